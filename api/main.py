@@ -329,3 +329,12 @@ async def get_websocket_stats() -> WebSocketStatsDict:
         "batch_stats": cast("BatchStatisticsDict", batch_stats),
         "summary": datetime.now(UTC).isoformat(),
     }
+
+
+if __name__ == "__main__":
+    # In-process launch for direct invocation (`python -m api.main`);
+    # skips spawning a second interpreter just to run uvicorn. The app
+    # is passed as an import string so --reload style workers still work
+    import uvicorn
+
+    uvicorn.run("api.main:app", host="0.0.0.0", port=10501)  # noqa: S104
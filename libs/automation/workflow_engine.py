@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import random
 import re
 import time
 from dataclasses import dataclass, field
@@ -23,6 +24,11 @@ WorkflowStatusType = dict[str, int | dict[str, str | int | bool | list[str]]]
 
 logger = logging.getLogger(__name__)
 
+# Retry backoff parameters: delays double per attempt but are capped, and
+# full jitter keeps concurrently retrying workflows from synchronizing
+RETRY_BACKOFF_MULTIPLIER = 2.0
+RETRY_MAX_DELAY = 30.0
+
 
 class ActionType(Enum):
     """Types of actions that can be executed."""
@@ -450,7 +456,8 @@ class WorkflowEngine:
             )
 
     async def _execute_action_with_retry(self, action: WorkflowAction, execution: WorkflowExecution) -> bool:
-        """Execute an action with retry logic."""
+        """Execute an action with retry logic using capped, jittered backoff."""
+        current_delay = float(action.retry_delay)
         for attempt in range(action.retry_count + 1):
             try:
                 result = await self._execute_single_action(action, execution)
@@ -482,13 +489,15 @@ class WorkflowEngine:
                 execution.results.append(error_info)
 
                 if attempt < action.retry_count:
+                    sleep_for = random.uniform(0, min(current_delay, RETRY_MAX_DELAY))  # noqa: S311
                     self.logger.warning(
-                        "Action failed (attempt %s), retrying in %ss: %s",
+                        "Action failed (attempt %s), retrying in %.1fs: %s",
                         attempt + 1,
-                        action.retry_delay,
+                        sleep_for,
                         e,
                     )
-                    await asyncio.sleep(action.retry_delay)
+                    await asyncio.sleep(sleep_for)
+                    current_delay *= RETRY_BACKOFF_MULTIPLIER
                 else:
                     self.logger.exception("Action failed after %s attempts")
 
@@ -654,7 +663,9 @@ class WorkflowEngine:
     async def _execute_delay(action: WorkflowAction) -> dict[str, int]:
         """Execute delay."""
         delay_seconds = int(action.command)
-        await asyncio.sleep(delay_seconds)
+        # Zero-duration delays skip the event-loop round-trip entirely
+        if delay_seconds > 0:
+            await asyncio.sleep(delay_seconds)
         return {"delay_seconds": delay_seconds}
 
     async def _execute_condition_check(self, action: WorkflowAction, execution: WorkflowExecution) -> dict[str, str | bool]:
@@ -39,6 +39,9 @@ class DefaultWorkspaceManager(WorkspaceManager):
         # Track active sandboxes
         self.active_sandboxes: set[str] = set()
 
+        # Track sandbox paths per agent so cleanup can skip directory scans
+        self._sandbox_paths: dict[str, Path] = {}
+
         # Track workspace assignments per agent
         self.agent_workspace_assignments: dict[str, str] = {}
 
@@ -123,6 +126,7 @@ class DefaultWorkspaceManager(WorkspaceManager):
 
             # Track active sandbox
             self.active_sandboxes.add(agent_id)
+            self._sandbox_paths[agent_id] = sandbox_path
 
             self.logger.info(f"Created sandbox for agent {agent_id} at {sandbox_path}")
             return sandbox_path
@@ -141,7 +145,16 @@ class DefaultWorkspaceManager(WorkspaceManager):
             True if cleanup was successful
         """
         try:
-            # Find sandbox by agent ID pattern
+            # Fast path: the sandbox was created by this process and its path
+            # is still tracked, so the directory scan can be skipped entirely
+            tracked_path = self._sandbox_paths.pop(agent_id, None)
+            if tracked_path is not None:
+                shutil.rmtree(tracked_path, ignore_errors=True)
+                self.active_sandboxes.discard(agent_id)
+                self.logger.info(f"Removed sandbox {tracked_path}")
+                return True
+
+            # Slow path (recovery): find sandbox by agent ID pattern
             pattern = f"agent-{agent_id}-*"
             sandbox_paths = list(self.base_path.glob(pattern))
 
@@ -722,6 +735,7 @@ class DefaultSecurityPolicy(SecurityPolicy):
 
             # Track active sandbox
             self.active_sandboxes.add(agent_id)
+            self._sandbox_paths[agent_id] = sandbox_path
 
             self.logger.info(f"Created workspace sandbox for agent {agent_id} in '{workspace_name}' at {sandbox_path}")
             return sandbox_path
@@ -5,6 +5,17 @@ import time
 from pathlib import Path
 from typing import Any, cast
 
+try:
+    # Optional: uvloop is a drop-in libuv-based event loop, typically 2-4x
+    # faster than stock asyncio on I/O-bound workloads like pane polling
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Module-level binding avoids the asyncio attribute lookup on every tick
+# of the monitoring loop
+_asleep = asyncio.sleep
+
 from libs.ai.adaptive_response import AdaptiveConfig, AdaptiveResponse
 from libs.automation.automation_manager import AutomationManager
 from libs.automation.context_detector import ContextType
@@ -77,6 +88,9 @@ class ClaudeMonitor:
         # High-performance async logging system
         self.async_logger: AsyncLogger | None = None
 
+        # Last activity message emitted, used to suppress duplicate updates
+        self._last_activity_msg: str | None = None
+
         self.logger = logging.getLogger(f"yesman.claude_monitor.{self.session_name}")
 
     def set_auto_next(self, enabled: bool) -> None:
@@ -147,7 +161,11 @@ class ClaudeMonitor:
 
     def _run_monitor_loop(self) -> None:
         """Run the monitor loop in its own thread with event loop."""
-        self._loop = asyncio.new_event_loop()
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+: run short-lived tasks synchronously until their
+            # first suspension, skipping a full event-loop iteration per task
+            self._loop.set_task_factory(asyncio.eager_task_factory)
         asyncio.set_event_loop(self._loop)
 
         try:
@@ -168,9 +186,21 @@ class ClaudeMonitor:
         self.logger.info("Starting monitoring loop for %s", self.session_name)
         last_content = ""
 
+        # Schedule ticks against the monotonic loop clock so the interval
+        # does not drift by the duration of the work done each iteration
+        loop = asyncio.get_running_loop()
+        interval = 1.0  # Check every second
+        next_tick = loop.time() + interval
+
         try:
             while self.is_running:
-                await asyncio.sleep(1)  # Check every second
+                delay = next_tick - loop.time()
+                if delay > 0:
+                    await _asleep(delay)
+                    next_tick += interval
+                else:
+                    # Fell behind (slow iteration); resynchronize
+                    next_tick = loop.time() + interval
 
                 try:
                     content = cast("str", cast("Any", self.session_manager).capture_pane_content())
@@ -210,7 +240,7 @@ class ClaudeMonitor:
                                         cast("Any", self.process_controller).send_input(ai_response)
                                     else:
                                         self.logger.warning(f"Cannot send input '{ai_response}' - process controller unavailable")
-                                    cast("Any", self.status_manager).update_activity(f"🤖 AI auto-responded: '{ai_response}' (confidence: {confidence:.2f})")
+                                    self._update_activity(f"🤖 AI auto-responded: '{ai_response}' (confidence: {confidence:.2f})")
                                     cast("Any", self.status_manager).record_response(prompt_info.type.value, ai_response, content)
                                     self.adaptive_response.confirm_response_success(
                                         prompt_info.question,
@@ -225,7 +255,7 @@ class ClaudeMonitor:
                             # Fall back to legacy pattern-based auto-response if AI didn't handle it
                             if self._auto_respond_to_selection(prompt_info):
                                 response = self._get_legacy_response(prompt_info)
-                                cast("Any", self.status_manager).update_activity(f"✅ Legacy auto-responded: '{response}' to {prompt_info.type.value}")
+                                self._update_activity(f"✅ Legacy auto-responded: '{response}' to {prompt_info.type.value}")
                                 cast("Any", self.status_manager).record_response(prompt_info.type.value, response, content)
                                 # Learn from legacy response for future AI improvements
                                 self.adaptive_response.learn_from_manual_response(
@@ -238,14 +268,14 @@ class ClaudeMonitor:
                                 continue
 
                         # If auto-response didn't handle it, show waiting status
-                        cast("Any", self.status_manager).update_activity(f"⏳ Waiting for input: {prompt_info.type.value}")
+                        self._update_activity(f"⏳ Waiting for input: {prompt_info.type.value}")
                         self.logger.debug(
                             "Prompt detected: %s - %s",
                             prompt_info.type.value,
                             prompt_info.question,
                         )
                     elif self.waiting_for_input:
-                        cast("Any", self.status_manager).update_activity("⏳ Waiting for user input...")
+                        self._update_activity("⏳ Waiting for user input...")
                     else:
                         # Clear prompt state if no longer waiting
                         self._clear_prompt_state()
@@ -296,12 +326,13 @@ class ClaudeMonitor:
 
                     # Update activity if content changed
                     if content != last_content:
-                        cast("Any", self.status_manager).update_activity("📝 Content updated")
+                        self._update_activity("📝 Content updated")
                         last_content = content
 
                 except Exception:
                     self.logger.exception("Error in monitoring loop")
-                    await asyncio.sleep(5)  # Wait longer on errors
+                    await _asleep(5)  # Wait longer on errors
+                    next_tick = loop.time() + interval
 
         except asyncio.CancelledError:
             self.logger.info("Monitoring loop cancelled")
@@ -325,6 +356,17 @@ class ClaudeMonitor:
 
         return prompt_info
 
+    def _update_activity(self, message: str) -> None:
+        """Forward an activity update, skipping consecutive duplicates.
+
+        The monitor ticks every second, so idle states would otherwise
+        re-emit the same message (and its downstream I/O) once per tick.
+        """
+        if message == self._last_activity_msg:
+            return
+        self._last_activity_msg = message
+        cast("Any", self.status_manager).update_activity(message)
+
     def _clear_prompt_state(self) -> None:
         """Clear the current prompt state."""
         self.current_prompt = None
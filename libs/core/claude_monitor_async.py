@@ -26,6 +26,13 @@ from typing import Any, cast
 
 import psutil
 
+try:
+    # Optional: uvloop accelerates the fresh event loops created by the
+    # legacy sync wrappers below; stock asyncio is used when unavailable
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from libs.ai.adaptive_response import AdaptiveConfig, AdaptiveResponse
 from libs.automation.automation_manager import AutomationManager
 from libs.dashboard.health_calculator import HealthCalculator
@@ -69,7 +76,10 @@ class AsyncClaudeMonitor:
         # Monitoring state
         self.is_running = False
         self._monitor_task: asyncio.Task | None = None
-        self._cleanup_task: asyncio.Task | None = None
+
+        # Lazily created event-loop runner shared by the legacy sync
+        # wrappers, amortizing loop setup/teardown across repeated calls
+        self._runner: asyncio.Runner | None = None
 
         # Performance monitoring
         self._loop_count = 0
@@ -459,11 +469,9 @@ class AsyncClaudeMonitor:
 
             await self._start_async_logging()
 
-            # Start the main monitoring task
-            self._monitor_task = asyncio.create_task(self._monitor_loop_async())
-
-            # Start cleanup task for maintenance
-            self._cleanup_task = asyncio.create_task(self._maintenance_loop())
+            # Supervise the monitor and maintenance loops as one unit so a
+            # failure in either cancels its sibling instead of orphaning it
+            self._monitor_task = asyncio.create_task(self._run_monitoring_tasks())
 
             await self._publish_status_event("success", f"Started async Claude monitor for {self.session_name}")
 
@@ -500,21 +508,14 @@ class AsyncClaudeMonitor:
         self.logger.info("Stopping async Claude monitor...")
         self.is_running = False
 
-        # Cancel monitoring tasks
-        tasks_to_cancel = []
+        # Cancel the supervisor task; the TaskGroup inside propagates the
+        # cancellation to the monitor and maintenance loops
         if self._monitor_task and not self._monitor_task.done():
-            tasks_to_cancel.append(self._monitor_task)
-        if self._cleanup_task and not self._cleanup_task.done():
-            tasks_to_cancel.append(self._cleanup_task)
-
-        if tasks_to_cancel:
-            # Cancel tasks gracefully
-            for task in tasks_to_cancel:
-                task.cancel()
+            self._monitor_task.cancel()
 
             # Wait for cancellation with timeout
             try:
-                await asyncio.wait_for(asyncio.gather(*tasks_to_cancel, return_exceptions=True), timeout=5.0)
+                await asyncio.wait_for(asyncio.gather(self._monitor_task, return_exceptions=True), timeout=5.0)
             except TimeoutError:
                 self.logger.warning("Monitor tasks cancellation timed out")
 
@@ -536,6 +537,12 @@ class AsyncClaudeMonitor:
         await self._publish_status_event("info", f"Stopped async Claude monitor for {self.session_name}")
         return True
 
+    async def _run_monitoring_tasks(self) -> None:
+        """Run the monitor and maintenance loops under one TaskGroup."""
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._monitor_loop_async())
+            tg.create_task(self._maintenance_loop())
+
     async def _monitor_loop_async(self) -> None:
         """Main async monitoring loop - non-blocking and event-driven.
 
@@ -1303,6 +1310,25 @@ class AsyncClaudeMonitor:
         return cast("dict[str, Any]", self.content_collector.get_collection_stats())
 
     # Legacy compatibility methods (delegate to original ClaudeMonitor for non-async operations)
+    def _get_runner(self) -> asyncio.Runner:
+        """Return the cached event-loop runner, creating it on first use."""
+        if self._runner is None:
+            loop_factory = uvloop.new_event_loop if uvloop is not None else None
+            self._runner = asyncio.Runner(loop_factory=loop_factory)
+        return self._runner
+
+    def close(self) -> None:
+        """Release the cached event-loop runner, if any."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:  # noqa: S110
+            pass
+
     def start_monitoring(self) -> bool:
         """Legacy sync method - creates async task."""
         if self.is_running:
@@ -1310,16 +1336,13 @@ class AsyncClaudeMonitor:
 
         # Create async task to run the monitoring
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, create a task
-                asyncio.create_task(self.start_monitoring_async())
-                return True
-            # If not in async context, run until complete
-            return loop.run_until_complete(self.start_monitoring_async())
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop, create new one
-            return asyncio.run(self.start_monitoring_async())
+            # No running loop: drive the coroutine on the cached runner
+            return self._get_runner().run(self.start_monitoring_async())
+        # Already in an async context: schedule as a task on the caller's loop
+        asyncio.create_task(self.start_monitoring_async())
+        return True
 
     def stop_monitoring(self) -> bool:
         """Legacy sync method - stops async monitoring."""
@@ -1327,16 +1350,13 @@ class AsyncClaudeMonitor:
             return True
 
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, create a task
-                asyncio.create_task(self.stop_monitoring_async())
-                return True
-            # If not in async context, run until complete
-            return loop.run_until_complete(self.stop_monitoring_async())
+            asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop, create new one
-            return asyncio.run(self.stop_monitoring_async())
+            # No running loop: drive the coroutine on the cached runner
+            return self._get_runner().run(self.stop_monitoring_async())
+        # Already in an async context: schedule as a task on the caller's loop
+        asyncio.create_task(self.stop_monitoring_async())
+        return True
 
 
 # Factory function for creating monitors based on async capability
@@ -1,44 +1,85 @@
 # Copyright notice.
 
+import functools
+import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
 """Configuration schemas using Pydantic for type safety and validation."""
 
 
+@functools.lru_cache(maxsize=1)
+def _home() -> str:
+    """Resolve the current user's home directory once per process."""
+    return os.path.expanduser("~")
+
+
+def _expand(path: str) -> str:
+    """Expand a leading ``~`` using the cached home directory.
+
+    Avoids a Path construction plus environment lookup per validated field;
+    paths without a leading ``~`` are returned unchanged.
+    """
+    if path.startswith("~"):
+        if path == "~":
+            return _home()
+        if path[1] == "/":
+            return _home() + path[1:]
+        return os.path.expanduser(path)  # ~user form
+    return path
+
+
 class WorkspaceDefinition(BaseModel):
     """Individual workspace configuration."""
 
+    # Read-only after load; frozen models skip __dict__-based mutation
+    # bookkeeping and allow instances to be shared safely
+    model_config = ConfigDict(frozen=True)
+
     rel_dir: str  # Relative or absolute directory path
     allowed_paths: list[str] = Field(default_factory=lambda: ["."])
     description: str | None = None
 
-    @field_validator("rel_dir", "allowed_paths", mode="after")
+    @model_validator(mode="before")
     @classmethod
-    def expand_paths(cls, v) -> str | list[str]:
-        """Expand user home directory in paths."""
-        if isinstance(v, str):
-            return str(Path(v).expanduser())
-        elif isinstance(v, list):
-            return [str(Path(path).expanduser()) for path in v]
-        return v
+    def expand_paths(cls, data: Any) -> Any:
+        """Expand user home directory in paths before the frozen model is built."""
+        if isinstance(data, dict):
+            data = dict(data)
+            if "rel_dir" in data:
+                data["rel_dir"] = _expand(data["rel_dir"])
+            if "allowed_paths" in data:
+                data["allowed_paths"] = [_expand(path) for path in data["allowed_paths"]]
+        return data
 
 
 class WorkspaceConfig(BaseModel):
     """Workspace configuration with base directory support."""
 
-    # Base directory for relative paths
-    base_dir: str = "~/projects"
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("base_dir", mode="after")
+    # Base directory for relative paths; the default expands at
+    # construction time like any provided value
+    base_dir: str = Field(default_factory=lambda: _expand("~/projects"))
+
+    @model_validator(mode="before")
     @classmethod
-    def expand_base_dir(cls, v: str) -> str:
-        """Expand user home directory in base directory path."""
-        return str(Path(v).expanduser())
+    def expand_base_dir(cls, data: Any) -> Any:
+        """Expand user home directory in the base directory path."""
+        if isinstance(data, dict) and "base_dir" in data:
+            data = {**data, "base_dir": _expand(data["base_dir"])}
+        return data
+
+
+# Canonical defaults built once at import; instances get a shallow copy so
+# the interned keys and values are shared instead of re-allocated per load
+_DEFAULT_LOGGING = MappingProxyType({"level": "INFO", "file": "~/.scripton/yesman/logs/yesman.log"})
+_DEFAULT_SERVER = MappingProxyType({"host": "localhost", "port": 10501})
 
 
 class YesmanConfigSchema(BaseModel):
@@ -63,20 +104,38 @@ class YesmanConfigSchema(BaseModel):
     after_script: str | None = None
 
     # Logging settings
-    logging: dict[str, Any] = Field(default_factory=lambda: {"level": "INFO", "file": "~/.scripton/yesman/logs/yesman.log"})
+    logging: dict[str, Any] = Field(default_factory=lambda: dict(_DEFAULT_LOGGING))
 
     # Server settings
-    server: dict[str, Any] = Field(default_factory=lambda: {"host": "localhost", "port": 10501})
+    server: dict[str, Any] = Field(default_factory=lambda: dict(_DEFAULT_SERVER))
 
     # Custom settings (allows complete flexibility)
     custom: dict[str, Any] = Field(default_factory=dict)
 
+    # Memoized workspace path resolutions; workspace definitions do not
+    # change after load, so resolving each name once is sufficient
+    _workspace_path_cache: dict[str, Path | None] = PrivateAttr(default_factory=dict)
+
     def get_absolute_workspace_path(self, workspace_name: str) -> Path | None:
         """Get absolute path for a workspace, resolving relative paths from base_dir."""
-        if not self.workspace_definitions or workspace_name not in self.workspace_definitions:
+        cache = self._workspace_path_cache
+        try:
+            return cache[workspace_name]
+        except KeyError:
+            pass
+
+        cache[workspace_name] = result = self._resolve_workspace_path(workspace_name)
+        return result
+
+    def _resolve_workspace_path(self, workspace_name: str) -> Path | None:
+        """Resolve a workspace path without consulting the cache."""
+        if not self.workspace_definitions:
+            return None
+
+        workspace_def = self.workspace_definitions.get(workspace_name)
+        if workspace_def is None:
             return None
 
-        workspace_def = self.workspace_definitions[workspace_name]
         workspace_path = Path(workspace_def.rel_dir)
 
         # If path is already absolute, return as-is
@@ -92,6 +151,9 @@ class YesmanConfigSchema(BaseModel):
 
     def model_post_init(self, __context: object) -> None:
         """Post-initialization validation and setup."""
-        # Expand paths in logging config
-        if isinstance(self.logging, dict) and "file" in self.logging:
-            self.logging["file"] = str(Path(self.logging["file"]).expanduser())
+        # Expand the logging path only when it actually starts with a tilde;
+        # absolute paths (the common case after a round-trip) skip the rewrite
+        if isinstance(self.logging, dict):
+            log_file = self.logging.get("file")
+            if isinstance(log_file, str) and log_file.startswith("~"):
+                self.logging["file"] = _expand(log_file)
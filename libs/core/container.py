@@ -26,6 +26,7 @@ class DIContainer:
         self._factories: dict[type, Callable] = {}
         self._singletons: dict[type, object] = {}
         self._resolving: set = set()  # Track circular dependencies
+        self._registered_view: frozenset[type] | None = None  # Cached key snapshot
 
     def register_singleton(self, service_type: type[T], instance: T) -> None:
         """Register a singleton instance.
@@ -35,6 +36,7 @@ class DIContainer:
             instance: The singleton instance to register.
         """
         self._singletons[service_type] = instance
+        self._registered_view = None
         # Remove from factories if it was registered there
         self._factories.pop(service_type, None)
         self._services.pop(service_type, None)
@@ -47,6 +49,7 @@ class DIContainer:
             factory: Factory function that creates instances.
         """
         self._factories[service_type] = factory
+        self._registered_view = None
         # Remove from singletons if it was registered there
         self._singletons.pop(service_type, None)
         self._services.pop(service_type, None)
@@ -59,6 +62,7 @@ class DIContainer:
             factory: Factory function that creates instances.
         """
         self._services[service_type] = factory
+        self._registered_view = None
         # Remove from other registrations
         self._singletons.pop(service_type, None)
         self._factories.pop(service_type, None)
@@ -117,12 +121,28 @@ class DIContainer:
         """
         return service_type in self._singletons or service_type in self._factories or service_type in self._services
 
+    def registered_types(self) -> frozenset[type]:
+        """Get a cached snapshot of all registered service types.
+
+        The snapshot is rebuilt only after a registration or clear();
+        resolving a factory keeps the key set intact, so batch checks
+        like subset tests stay a single hash operation.
+
+        Returns:
+            Frozen set of registered type keys
+        """
+        view = self._registered_view
+        if view is None:
+            view = self._registered_view = frozenset(self._singletons) | frozenset(self._factories) | frozenset(self._services)
+        return view
+
     def clear(self) -> None:
         """Clear all registrations and reset the container."""
         self._services.clear()
         self._factories.clear()
         self._singletons.clear()
         self._resolving.clear()
+        self._registered_view = None
 
     def get_registered_services(self) -> dict[str, str]:
         """Get information about all registered services.
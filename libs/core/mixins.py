@@ -2,7 +2,10 @@
 
 # Copyright notice.
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 # Copyright (c) 2024 Yesman Claude Project
@@ -19,6 +22,8 @@ These mixins provide standardized interfaces for common patterns:
 class StatisticsProviderMixin(ABC):
     """Mixin for classes that provide statistics information."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics information from the implementing class.
@@ -36,13 +41,14 @@ class StatisticsProviderMixin(ABC):
                 "last_updated": "2025-07-16T10:30:00"
             }
         """
-        msg = "Subclasses must implement get_statistics()"
-        raise NotImplementedError(msg)
+        ...
 
 
 class StatusManagerMixin(ABC):
     """Mixin for status and activity management."""
 
+    __slots__ = ()
+
     @abstractmethod
     def update_status(self, status: str) -> None:
         """Update the current status.
@@ -54,8 +60,7 @@ class StatusManagerMixin(ABC):
         Raises:
             ValueError: If the status value is invalid
         """
-        msg = "Subclasses must implement update_status()"
-        raise NotImplementedError(msg)
+        ...
 
     @abstractmethod
     def update_activity(self, activity: str) -> None:
@@ -69,13 +74,14 @@ class StatusManagerMixin(ABC):
             update_activity("Processing batch 5 of 10")
             update_activity("Waiting for user input")
         """
-        msg = "Subclasses must implement update_activity()"
-        raise NotImplementedError(msg)
+        ...
 
 
 class LayoutManagerMixin(ABC):
     """Mixin for layout management in UI components."""
 
+    __slots__ = ()
+
     @abstractmethod
     def create_layout(self) -> object:
         """Create and return a layout object.
@@ -85,8 +91,7 @@ class LayoutManagerMixin(ABC):
                 For console apps, this might be a Layout object.
                 For web apps, this might be a dictionary describing the layout.
         """
-        msg = "Subclasses must implement create_layout()"
-        raise NotImplementedError(msg)
+        ...
 
     @abstractmethod
     def update_layout(self, layout: object) -> None:
@@ -100,8 +105,7 @@ class LayoutManagerMixin(ABC):
             TypeError: If the layout type doesn't match expected type
             ValueError: If the layout configuration is invalid
         """
-        msg = "Subclasses must implement update_layout()"
-        raise NotImplementedError(msg)
+        ...
 
 
 # Optional: Concrete mixin implementations with default behavior
@@ -110,31 +114,42 @@ class DefaultStatisticsProviderMixin(StatisticsProviderMixin):
     functionality.
     """
 
+    __slots__ = ("_statistics", "_dirty", "_stats_view")
+
     def __init__(self) -> None:
         self._statistics = {
             "total_operations": 0,
             "successful_operations": 0,
             "failed_operations": 0,
         }
+        self._dirty = True
+        self._stats_view: Mapping[str, Any] = {}
 
-    def get_statistics(self) -> dict[str, Any]:
+    def get_statistics(self) -> Mapping[str, Any]:
         """Get current statistics with calculated success rate.
 
+        The computed view is cached between counter changes, so frequent
+        polling (e.g. from the dashboard) reuses the same read-only mapping
+        instead of copying the dict and redoing the division per call.
+
         Returns:
-        dict[str, Any]: Dictionary containing statistics with calculated success rate.
+        Mapping[str, Any]: Read-only mapping of statistics with calculated success rate.
         """
-        stats = self._statistics.copy()
-        total = stats["total_operations"]
-        if total > 0:
-            stats["success_rate"] = int((stats["successful_operations"] / total) * 100)
-        else:
-            stats["success_rate"] = 0
-        return stats
+        if self._dirty:
+            stats = self._statistics.copy()
+            total = stats["total_operations"]
+            # Integer floor division matches int(float-ratio * 100) for
+            # non-negative counters without going through a float
+            stats["success_rate"] = stats["successful_operations"] * 100 // total if total else 0
+            self._stats_view = MappingProxyType(stats)
+            self._dirty = False
+        return self._stats_view
 
     def _increment_stat(self, stat_name: str, value: int = 1) -> None:
         """Helper method to increment statistics counters."""
         if stat_name in self._statistics:
             self._statistics[stat_name] += value
+            self._dirty = True
 
 
 class DefaultStatusManagerMixin(StatusManagerMixin):
@@ -142,7 +157,15 @@ class DefaultStatusManagerMixin(StatusManagerMixin):
     functionality.
     """
 
-    VALID_STATUSES = {"running", "stopped", "paused", "error", "initializing", "idle"}
+    __slots__ = ("_status", "_activity")
+
+    VALID_STATUSES: frozenset[str] = frozenset({"running", "stopped", "paused", "error", "initializing", "idle"})
+    # Rendered once at class scope so the error path does not re-format
+    # the full status set on every invalid update
+    _VALID_STATUSES_REPR = ", ".join(sorted(VALID_STATUSES))
+    # Interned canonical instances; lookup doubles as validation and every
+    # manager stores the same string object instead of a per-call copy
+    _INTERNED_STATUSES = {status: sys.intern(status) for status in VALID_STATUSES}
 
     def __init__(self) -> None:
         self._status = "idle"
@@ -150,17 +173,20 @@ class DefaultStatusManagerMixin(StatusManagerMixin):
 
     def update_status(self, status: str) -> None:
         """Update status with validation."""
-        if status not in self.VALID_STATUSES:
-            msg = f"Invalid status: {status}. Must be one of {self.VALID_STATUSES}"
-            raise ValueError(msg)
-        self._status = status
+        try:
+            self._status = self._INTERNED_STATUSES[status]
+        except KeyError:
+            msg = f"Invalid status: {status}. Must be one of {self._VALID_STATUSES_REPR}"
+            raise ValueError(msg) from None
 
     def update_activity(self, activity: str) -> None:
         """Update current activity description."""
         if not activity or not isinstance(activity, str):
             msg = "Activity must be a non-empty string"
             raise ValueError(msg)
-        self._activity = activity
+        # Short activity messages repeat across agents; interning dedupes
+        # them and makes later equality checks pointer comparisons
+        self._activity = sys.intern(activity) if len(activity) < 64 else activity
 
     @property
     def current_status(self) -> str:
@@ -1,27 +1,38 @@
 # Copyright notice.
 
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
-from libs.claude.headless_adapter import HeadlessAdapter
-from libs.claude.interactive_adapter import InteractiveAdapter
-from libs.claude.interfaces import ClaudeAgentService
-from libs.claude.workspace import DefaultSecurityPolicy, DefaultWorkspaceManager
 from libs.core.container import container
-from libs.core.session_manager import SessionManager
-from libs.tmux_manager import TmuxManager
-from libs.workflows.execution_engine import WorkflowExecutionEngine
-from libs.workflows.workflow_service import WorkflowService
 from libs.yesman_config import YesmanConfig
 
-# Auto-initialize services when module is imported
+if TYPE_CHECKING:
+    from libs.claude.interfaces import ClaudeAgentService
+    from libs.core.session_manager import SessionManager
+    from libs.tmux_manager import TmuxManager
+    from libs.workflows.execution_engine import WorkflowExecutionEngine
+    from libs.workflows.workflow_service import WorkflowService
 
 # Copyright (c) 2024 Yesman Claude Project
 # Licensed under the MIT License
-"""Service registration and DI container setup."""
+"""Service registration and DI container setup.
+
+Adapter and manager modules are imported inside the registration
+functions and factory closures, so importing this module does not pull
+in tmux, Claude adapter, or workflow (langchain) dependencies until a
+service of that kind is actually requested.
+"""
 
 
 def register_core_services() -> None:
     """Register all core services with the DI container."""
+    from libs.core.session_manager import SessionManager
+    from libs.tmux_manager import TmuxManager
+
     # Register YesmanConfig as a singleton factory
     container.register_factory(YesmanConfig, YesmanConfig)
 
@@ -38,42 +49,85 @@ def register_core_services() -> None:
     register_workflow_services()
 
 
+@dataclass(frozen=True, slots=True)
+class _ClaudeBootSpec:
+    """Static snapshot of the Claude config relevant to adapter selection.
+
+    The config does not change during the process lifetime, so the
+    getattr/hasattr reflection over the schema runs once instead of on
+    every service resolution.
+    """
+
+    headless: bool
+    allowed_tools: tuple[str, ...] = ()
+    forbidden_paths: tuple[Path, ...] = ()
+    max_concurrent: int = 1
+    workspace_root: str = ""
+    claude_binary: str = ""
+
+
+@functools.lru_cache(maxsize=1)
+def _build_claude_spec(config: YesmanConfig) -> _ClaudeBootSpec:
+    """Derive the adapter boot spec from the config schema once."""
+    claude_config = getattr(config._config_schema, "claude", None)
+
+    if claude_config and hasattr(claude_config, "mode") and claude_config.mode == "headless" and hasattr(claude_config, "headless") and claude_config.headless.enabled:
+        headless = claude_config.headless
+        return _ClaudeBootSpec(
+            headless=True,
+            allowed_tools=tuple(headless.allowed_tools),
+            forbidden_paths=tuple(Path(p) for p in headless.forbidden_paths),
+            max_concurrent=headless.max_concurrent_agents,
+            workspace_root=headless.workspace_root,
+            claude_binary=headless.claude_binary_path,
+        )
+
+    return _ClaudeBootSpec(headless=False)
+
+
+# Resolved once at import; DefaultWorkspaceManager receives the same
+# allowed-path objects on every adapter construction
+_YESMAN_HOME = Path("~/.scripton/yesman").expanduser()
+
+
 def register_claude_services() -> None:
     """Register Claude-related services with the DI container."""
+    from libs.claude.interfaces import ClaudeAgentService
 
     def create_claude_service() -> ClaudeAgentService:
         """Factory function to create appropriate Claude service based on config."""
-        config = container.resolve(YesmanConfig)
+        from libs.claude.headless_adapter import HeadlessAdapter
+        from libs.claude.interactive_adapter import InteractiveAdapter
+        from libs.claude.workspace import DefaultSecurityPolicy, DefaultWorkspaceManager
 
-        # Check if claude config exists
-        claude_config = getattr(config._config_schema, "claude", None)
+        spec = _build_claude_spec(container.resolve(YesmanConfig))
 
-        if claude_config and hasattr(claude_config, "mode") and claude_config.mode == "headless" and hasattr(claude_config, "headless") and claude_config.headless.enabled:
+        if spec.headless:
             # Create headless adapter
             security_policy = DefaultSecurityPolicy(
-                allowed_tools=claude_config.headless.allowed_tools,
-                forbidden_paths=[Path(p) for p in claude_config.headless.forbidden_paths],
-                max_concurrent_agents=claude_config.headless.max_concurrent_agents,
+                allowed_tools=list(spec.allowed_tools),
+                forbidden_paths=list(spec.forbidden_paths),
+                max_concurrent_agents=spec.max_concurrent,
             )
 
             workspace_manager = DefaultWorkspaceManager(
-                base_path=Path(claude_config.headless.workspace_root),
-                allowed_paths=[Path("~/.scripton/yesman").expanduser(), Path.cwd()],
+                base_path=Path(spec.workspace_root),
+                allowed_paths=[_YESMAN_HOME, Path.cwd()],
                 security_policy=security_policy,
             )
 
             adapter = HeadlessAdapter(
                 workspace_manager=workspace_manager,
-                claude_binary=claude_config.headless.claude_binary_path,
-                max_concurrent=claude_config.headless.max_concurrent_agents,
+                claude_binary=spec.claude_binary,
+                max_concurrent=spec.max_concurrent,
             )
 
             # Start cleanup task
             adapter.start_cleanup_task()
             return adapter
-        else:
-            # Create interactive adapter (fallback)
-            return InteractiveAdapter()
+
+        # Create interactive adapter (fallback)
+        return InteractiveAdapter()
 
     # Register Claude service factory
     container.register_factory(ClaudeAgentService, create_claude_service)
@@ -81,15 +135,21 @@ def register_claude_services() -> None:
 
 def register_workflow_services() -> None:
     """Register workflow-related services with the DI container."""
+    from libs.workflows.execution_engine import WorkflowExecutionEngine
+    from libs.workflows.workflow_service import WorkflowService
 
     def create_workflow_execution_engine() -> WorkflowExecutionEngine:
         """Factory function to create workflow execution engine."""
+        from libs.tmux_manager import TmuxManager
+
         config = container.resolve(YesmanConfig)
         tmux_manager = container.resolve(TmuxManager)
         return WorkflowExecutionEngine(config=config, tmux_manager=tmux_manager)
 
     def create_workflow_service() -> WorkflowService:
         """Factory function to create workflow service."""
+        from libs.tmux_manager import TmuxManager
+
         config = container.resolve(YesmanConfig)
         tmux_manager = container.resolve(TmuxManager)
         execution_engine = container.resolve(WorkflowExecutionEngine)
@@ -109,8 +169,12 @@ def register_test_services(config: YesmanConfig | None = None, tmux_manager: Tmu
         config: Optional mock config instance
         tmux_manager: Optional mock tmux manager instance.
     """
-    # Clear existing registrations
+    from libs.core.session_manager import SessionManager
+    from libs.tmux_manager import TmuxManager
+
+    # Clear existing registrations and memoized instances
     container.clear()
+    _cached.clear()
 
     # Register provided mocks or create default ones
     if config is not None:
@@ -127,13 +191,32 @@ def register_test_services(config: YesmanConfig | None = None, tmux_manager: Tmu
     container.register_factory(SessionManager, SessionManager)
 
 
+# Resolved service instances keyed by type; steady-state lookups become a
+# single dict read instead of container bookkeeping plus registration checks
+_cached: dict[type, object] = {}
+
+
+def _resolve_cached(service_type: type) -> object:
+    """Resolve a service through the container, memoizing the instance."""
+    obj = _cached.get(service_type)
+    if obj is None:
+        # Only bootstrap when the requested type itself is missing;
+        # register_test_services installs a partial set of mocks, and a
+        # full is-initialized check would clobber them with real services
+        if not container.is_registered(service_type):
+            initialize_services()
+        obj = container.resolve(service_type)
+        _cached[service_type] = obj
+    return obj
+
+
 def get_config() -> YesmanConfig:
     """Convenience function to get YesmanConfig from container.
 
     Returns:
         YesmanConfig: Description of return value.
     """
-    return container.resolve(YesmanConfig)
+    return cast("YesmanConfig", _resolve_cached(YesmanConfig))
 
 
 def get_tmux_manager() -> TmuxManager:
@@ -142,7 +225,9 @@ def get_tmux_manager() -> TmuxManager:
     Returns:
         TmuxManager: Description of return value.
     """
-    return container.resolve(TmuxManager)
+    from libs.tmux_manager import TmuxManager
+
+    return cast("TmuxManager", _resolve_cached(TmuxManager))
 
 
 def get_session_manager() -> SessionManager:
@@ -151,7 +236,9 @@ def get_session_manager() -> SessionManager:
     Returns:
         SessionManager: Description of return value.
     """
-    return container.resolve(SessionManager)
+    from libs.core.session_manager import SessionManager
+
+    return cast("SessionManager", _resolve_cached(SessionManager))
 
 
 def get_claude_service() -> ClaudeAgentService:
@@ -160,7 +247,9 @@ def get_claude_service() -> ClaudeAgentService:
     Returns:
         ClaudeAgentService: The configured Claude agent service
     """
-    return container.resolve(ClaudeAgentService)
+    from libs.claude.interfaces import ClaudeAgentService
+
+    return cast("ClaudeAgentService", _resolve_cached(ClaudeAgentService))
 
 
 def get_workflow_service() -> WorkflowService:
@@ -169,7 +258,9 @@ def get_workflow_service() -> WorkflowService:
     Returns:
         WorkflowService: The configured workflow service
     """
-    return container.resolve(WorkflowService)
+    from libs.workflows.workflow_service import WorkflowService
+
+    return cast("WorkflowService", _resolve_cached(WorkflowService))
 
 
 def get_workflow_execution_engine() -> WorkflowExecutionEngine:
@@ -178,7 +269,9 @@ def get_workflow_execution_engine() -> WorkflowExecutionEngine:
     Returns:
         WorkflowExecutionEngine: The configured workflow execution engine
     """
-    return container.resolve(WorkflowExecutionEngine)
+    from libs.workflows.execution_engine import WorkflowExecutionEngine
+
+    return cast("WorkflowExecutionEngine", _resolve_cached(WorkflowExecutionEngine))
 
 
 def is_container_initialized() -> bool:
@@ -187,13 +280,19 @@ def is_container_initialized() -> bool:
     Returns:
         bool: Description of return value.
     """
-    return container.is_registered(YesmanConfig) and container.is_registered(TmuxManager) and container.is_registered(SessionManager) and container.is_registered(WorkflowService)
+    from libs.core.session_manager import SessionManager
+    from libs.tmux_manager import TmuxManager
+    from libs.workflows.workflow_service import WorkflowService
+
+    return {YesmanConfig, TmuxManager, SessionManager, WorkflowService} <= container.registered_types()
 
 
 def initialize_services() -> None:
-    """Initialize services if not already done."""
+    """Initialize services if not already done.
+
+    Registration is deferred until a service is first requested so that
+    importing this module (e.g. purely for type hints) does not construct
+    config, tmux, or workflow factories.
+    """
     if not is_container_initialized():
         register_core_services()
-
-
-initialize_services()
@@ -1,5 +1,7 @@
 """Project health calculation and monitoring."""
 
+from __future__ import annotations
+
 import time
 from pathlib import Path
 from typing import Any
@@ -8,14 +10,20 @@ from typing import Any
 class HealthScore:
     """Health score result."""
 
+    __slots__ = ("score", "level", "emoji", "timestamp", "_dict")
+
     def __init__(self, score: int, level: str, emoji: str):
         self.score = score
         self.level = level
         self.emoji = emoji
+        # The score is immutable, so the timestamp and serialized form are
+        # fixed at construction instead of rebuilt per to_dict() call
+        self.timestamp = time.time()
+        self._dict = {"score": score, "level": level, "emoji": emoji, "timestamp": self.timestamp}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {"score": self.score, "level": self.level, "emoji": self.emoji, "timestamp": time.time()}
+        return self._dict
 
 
 class HealthCalculator:
@@ -1,33 +1,61 @@
 """Project health widget for dashboard."""
 
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Health signals change on second/minute timescales while the dashboard
+# polls per frame, so cached views stay valid for a few seconds
+_CACHE_TTL = 5.0
+
 
 class ProjectHealth:
     """Project health monitoring widget."""
 
     def __init__(self):
-        pass
+        self._cache: dict[str, tuple[float, Mapping[str, Any]]] = {}
+
+    def _cached_view(self, key: str, build: Callable[[], dict[str, Any]]) -> Mapping[str, Any]:
+        """Return a cached read-only view for ``key``, rebuilding after the TTL."""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < _CACHE_TTL:
+            return hit[1]
+        view: Mapping[str, Any] = MappingProxyType(build())
+        self._cache[key] = (now, view)
+        return view
 
-    def get_health_metrics(self) -> dict[str, Any]:
+    def get_health_metrics(self) -> Mapping[str, Any]:
         """Get current project health metrics."""
-        return {"overall_score": 75, "status": "healthy", "metrics": {"code_quality": 80, "test_coverage": 70, "dependencies": 75}}
+        return self._cached_view(
+            "metrics",
+            lambda: {"overall_score": 75, "status": "healthy", "metrics": {"code_quality": 80, "test_coverage": 70, "dependencies": 75}},
+        )
 
-    def get_health_trends(self, days: int = 7) -> dict[str, Any]:
+    def get_health_trends(self, days: int = 7) -> Mapping[str, Any]:
         """Get health trends over time."""
-        return {"trend": "stable", "change": 0, "history": []}
+        return self._cached_view(
+            f"trends:{days}",
+            lambda: {"trend": "stable", "change": 0, "history": []},
+        )
 
-    def calculate_health(self) -> dict[str, Any]:
+    def calculate_health(self) -> Mapping[str, Any]:
         """Calculate comprehensive project health."""
-        return {
-            "overall_score": 75,
-            "build_score": 85,
-            "test_score": 70,
-            "deps_score": 90,
-            "security_score": 80,
-            "perf_score": 65,
-            "quality_score": 85,
-            "git_score": 95,
-            "docs_score": 60,
-            "suggestions": ["Consider increasing test coverage", "Update outdated dependencies", "Add more documentation"],
-        }
+        return self._cached_view(
+            "calc",
+            lambda: {
+                "overall_score": 75,
+                "build_score": 85,
+                "test_score": 70,
+                "deps_score": 90,
+                "security_score": 80,
+                "perf_score": 65,
+                "quality_score": 85,
+                "git_score": 95,
+                "docs_score": 60,
+                "suggestions": ("Consider increasing test coverage", "Update outdated dependencies", "Add more documentation"),
+            },
+        )
@@ -3,8 +3,23 @@
 This package provides integration between LangChain workflows and Claude Code CLI,
 enabling advanced features like session continuity, MCP server integration,
 and complex multi-step automation workflows.
+
+``ClaudeAgent`` is imported lazily (PEP 562): the LangChain stack only
+loads on first attribute access, not when this package is imported.
 """
 
-from libs.langchain_integration.langchain_claude_integration import ClaudeAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from libs.langchain_integration.langchain_claude_integration import ClaudeAgent
 
 __all__ = ["ClaudeAgent"]
+
+
+def __getattr__(name: str) -> object:
+    if name == "ClaudeAgent":
+        from libs.langchain_integration.langchain_claude_integration import ClaudeAgent
+
+        globals()["ClaudeAgent"] = ClaudeAgent
+        return ClaudeAgent
+    raise AttributeError(name)
@@ -1,6 +1,6 @@
+import functools
 from pathlib import Path
 
-import tmuxp
 import yaml
 from jinja2 import Template
 
@@ -12,6 +12,20 @@ from jinja2 import Template
 This module provides utilities for generating tmux session configurations
 """
 
+# Prefer the libyaml C loader when available; it parses YAML far faster
+# than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# The template file never changes at runtime, so reading and compiling
+# it once per process is sufficient
+@functools.cache
+def _load_template() -> Template:
+    """Read and compile the session template, caching the result."""
+    template_path = Path(__file__).parent / "session_template.yaml"
+    with open(template_path, encoding="utf-8") as f:
+        return Template(f.read())
+
 
 def generate(session_name: str) -> object:
     """Generate a tmux session configuration from a template.
@@ -22,19 +36,17 @@ def generate(session_name: str) -> object:
     Returns:
         dict: Generated tmux session configuration
     """
-    template_path = Path(__file__).parent / "session_template.yaml"
-    with open(template_path, encoding="utf-8") as f:
-        raw = f.read()
-
     # 템플릿 렌더링
-    rendered = Template(raw).render(
+    rendered = _load_template().render(
         session_name=session_name,
     )
 
     # YAML → dict
-    return yaml.safe_load(rendered)
+    return yaml.load(rendered, Loader=_YAML_LOADER)  # noqa: S506
 
 
 if __name__ == "__main__":
+    import tmuxp
+
     config = generate(session_name="my-uv-project")
     tmuxp.cli.load_workspace(config)
@@ -28,12 +28,20 @@ class ContentLimits:
 
 
 class ValidationPatterns:
-    """Common validation regex patterns."""
+    """Common validation patterns, compiled once at import time."""
 
-    SESSION_NAME = r"^[a-zA-Z0-9_-]+$"
-    WINDOW_NAME = r"^[a-zA-Z0-9_\-\s]+$"
-    PORT_NUMBER = r"^[0-9]{1,5}$"
-    LOG_LEVEL = r"^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$"
+    SESSION_NAME = re.compile(r"^[a-zA-Z0-9_-]+$")
+    WINDOW_NAME = re.compile(r"^[a-zA-Z0-9_\-\s]+$")
+    PORT_NUMBER = re.compile(r"^[0-9]{1,5}$")
+    # Small closed sets are cheaper to check by membership than by regex
+    LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+_DANGEROUS_COMMAND_PATTERNS = [
+    re.compile(r";\s*rm\s+-rf\s+/", re.IGNORECASE),  # rm -rf /
+    re.compile(r">\s*/dev/sda", re.IGNORECASE),  # write to disk device
+    re.compile(r":()\s*{\s*:\|:&\s*};", re.IGNORECASE),  # fork bomb
+]
 
 
 class ValidationError(Exception):
@@ -71,7 +79,7 @@ def validate_session_name(name: str, max_length: int | None = None) -> tuple[boo
         return False, f"Session name exceeds maximum length of {max_len} characters"
 
     # Check pattern
-    if not re.match(ValidationPatterns.SESSION_NAME, name):
+    if not ValidationPatterns.SESSION_NAME.match(name):
         return False, ("Session name contains invalid characters. Only letters, numbers, underscores, and hyphens are allowed")
 
     # Check if it starts with a number (tmux restriction)
@@ -114,7 +122,7 @@ def validate_window_name(name: str, max_length: int | None = None) -> tuple[bool
         return False, f"Window name exceeds maximum length of {max_len} characters"
 
     # Check pattern (windows allow spaces)
-    if not re.match(ValidationPatterns.WINDOW_NAME, name):
+    if not ValidationPatterns.WINDOW_NAME.match(name):
         return False, ("Window name contains invalid characters. Only letters, numbers, underscores, hyphens, and spaces are allowed")
 
     return True, None
@@ -140,14 +148,8 @@ def validate_pane_command(command: str, max_length: int | None = None) -> tuple[
         return False, f"Command exceeds maximum length of {max_len} characters"
 
     # Basic security checks
-    dangerous_patterns = [
-        r";\s*rm\s+-rf\s+/",  # rm -rf /
-        r">\s*/dev/sda",  # write to disk device
-        r":()\s*{\s*:\|:&\s*};",  # fork bomb
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
+    for pattern in _DANGEROUS_COMMAND_PATTERNS:
+        if pattern.search(command):
             return False, "Command contains potentially dangerous pattern"
 
     return True, None
@@ -207,7 +209,7 @@ def validate_port_number(port: str) -> tuple[bool, str | None]:
         return False, "Port number cannot be empty"
 
     # Check if it matches the pattern
-    if not re.match(ValidationPatterns.PORT_NUMBER, port):
+    if not ValidationPatterns.PORT_NUMBER.match(port):
         return False, "Port must be a number between 1 and 65535"
 
     # Check range
@@ -235,8 +237,8 @@ def validate_log_level(level: str) -> tuple[bool, str | None]:
     if not level:
         return False, "Log level cannot be empty"
 
-    # Check pattern
-    if not re.match(ValidationPatterns.LOG_LEVEL, level.upper()):
+    # Check membership in the closed set of levels
+    if level.upper() not in ValidationPatterns.LOG_LEVELS:
         return (
             False,
             "Invalid log level. Must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL",
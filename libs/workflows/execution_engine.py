@@ -1,7 +1,13 @@
 """Async workflow execution engine with background task support."""
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import json
 import logging
+import re
+import weakref
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -13,6 +19,71 @@ from libs.yesman_config import YesmanConfig
 from .models import ExecutionResult, StepType, WorkflowExecution, WorkflowStatus, WorkflowStep
 
 
+# Below this many variables, a specialized straight-line function beats
+# the regex state machine; above it, the single-pass scan wins
+_CODEGEN_MAX_KEYS = 4
+
+
+@functools.lru_cache(maxsize=64)
+def _substituter(keys: tuple[str, ...]):
+    """Generate a specialized substitution function for a small key set.
+
+    The emitted code is a flat sequence of str.replace calls running at
+    plain bytecode speed, cached per key-tuple like the regex variant.
+    """
+    lines = ["def _sub(text, variables):"]
+    for key in keys:
+        lines.append(f"    value = variables[{key!r}]")
+        # ${key} must be replaced before {key}, which it contains
+        lines.append(f"    text = text.replace({'${' + key + '}'!r}, value)")
+        lines.append(f"    text = text.replace({'{' + key + '}'!r}, value)")
+    lines.append("    return text")
+    namespace: dict[str, object] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["_sub"]
+
+
+@functools.lru_cache(maxsize=64)
+def _variable_pattern(keys: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a substitution pattern matching {key} and ${key} forms.
+
+    Cached per key-tuple so repeated steps sharing a variables dict reuse
+    the compiled pattern.
+    """
+    return re.compile(r"\$?\{(" + "|".join(map(re.escape, keys)) + r")\}")
+
+
+# Content-addressed step results survive across engine instances, so a
+# re-run with unchanged inputs skips the Claude call entirely
+_STEP_CACHE_PATH = Path("~/.scripton/yesman/cache/step_cache.json").expanduser()
+
+# Mixed into every step fingerprint; bump whenever the Claude model,
+# CLI invocation, or prompt format changes so stale results stop
+# replaying across upgrades
+_STEP_CACHE_VERSION = "1"
+
+# Completed steps mark the cache dirty; one write covers a burst of
+# completions instead of rewriting the JSON file per step
+_STEP_CACHE_FLUSH_DELAY = 5.0
+
+
+@functools.lru_cache(maxsize=256)
+def _format_context(items: tuple[tuple[str, str], ...]) -> str:
+    """Join context items into the prompt block, cached by content."""
+    return "\n".join(f"- {k}: {v}" for k, v in items)
+
+
+# Step-type guidance prompts, built once at import instead of per step
+_CUSTOM_PROMPTS: dict[StepType, str] = {
+    StepType.ANALYSIS: "Perform detailed analysis with comprehensive insights. Focus on providing actionable recommendations.",
+    StepType.IMPLEMENTATION: "Implement following best practices and conventions. Ensure code quality and maintainability.",
+    StepType.TESTING: "Create thorough tests with good coverage. Include edge cases and error scenarios.",
+    StepType.DEPLOYMENT: "Prepare for production deployment with safety checks and rollback plans.",
+    StepType.GENERAL: "Execute the requested task with attention to detail and best practices.",
+}
+_DEFAULT_CUSTOM_PROMPT = _CUSTOM_PROMPTS[StepType.GENERAL]
+
+
 class ExecutionEngineError(YesmanError):
     """Execution engine specific error."""
 
@@ -40,54 +111,145 @@ class WorkflowExecutionEngine:
         self.running_executions: dict[str, WorkflowExecution] = {}
         self.execution_tasks: dict[str, asyncio.Task] = {}
 
-        # Claude agent pool
-        self.claude_agents: dict[str, ClaudeAgent] = {}
-
-        # Semaphore for controlling concurrency
-        self.execution_semaphore = asyncio.Semaphore(max_concurrent)
-
-        # Background cleanup task
-        self.cleanup_task: asyncio.Task | None = None
-        self._start_cleanup_task()
-
-    def _start_cleanup_task(self) -> None:
-        """Start background cleanup task."""
-
-        async def cleanup_routine():
-            while True:
-                try:
-                    await asyncio.sleep(300)  # Run every 5 minutes
-                    await self._cleanup_finished_tasks()
-                except asyncio.CancelledError:
-                    break
-                except Exception:
-                    self.logger.exception("Cleanup task error")
-
-        self.cleanup_task = asyncio.create_task(cleanup_routine())
-
-    async def _cleanup_finished_tasks(self) -> None:
-        """Clean up finished execution tasks."""
-        finished_tasks = []
-
-        for execution_id, task in self.execution_tasks.items():
-            if task.done():
-                finished_tasks.append(execution_id)
-
-                # Handle task exceptions
-                try:
-                    await task
-                except Exception as e:
-                    self.logger.exception("Execution task %s failed", execution_id)
-
-                    # Update execution status
-                    execution = self.running_executions.get(execution_id)
-                    if execution:
-                        execution.status = WorkflowStatus.FAILED
-                        execution.add_error("execution_engine", str(e))
-
-        # Remove finished tasks
-        for execution_id in finished_tasks:
-            self.execution_tasks.pop(execution_id, None)
+        # Claude agent pool; weak values let agents (and their session
+        # handles) be collected once the owning workflow drops its reference,
+        # even if an error path skips the explicit pop
+        self.claude_agents: weakref.WeakValueDictionary[str, ClaudeAgent] = weakref.WeakValueDictionary()
+
+        # Concurrency gate; a plain Lock is lighter than a Semaphore when
+        # only one workflow may run at a time
+        self.execution_semaphore: asyncio.Semaphore | asyncio.Lock = asyncio.Semaphore(max_concurrent) if max_concurrent > 1 else asyncio.Lock()
+
+        # Strong references to spawned tasks; the event loop only keeps
+        # weak references, so without these a task can be collected mid-flight
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Dedicated pool for blocking Claude CLI calls, sized to the
+        # semaphore so they neither starve nor contend with the loop's
+        # default executor
+        self._claude_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent * 2,
+            thread_name_prefix="claude-step",
+        )
+
+        # Fingerprint -> result cache for identical step inputs
+        self._step_cache: dict[str, str] = self._load_step_cache()
+        self._step_cache_dirty = False
+        self._step_cache_flush_task: asyncio.Task | None = None
+
+        # Latest-only checkpoint queue consumed by a single writer task,
+        # so checkpoint persistence never blocks step progress
+        self._checkpoint_queue: asyncio.Queue[tuple[WorkflowExecution, int]] = asyncio.Queue(maxsize=1)
+        self._checkpoint_writer_task: asyncio.Task | None = None
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Create a task and keep a strong reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    @staticmethod
+    def _load_step_cache() -> dict[str, str]:
+        """Load the persisted step-result cache, tolerating a missing file."""
+        try:
+            with open(_STEP_CACHE_PATH, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _write_step_cache(self) -> None:
+        """Persist the step-result cache to disk (best effort)."""
+        try:
+            _STEP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(_STEP_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._step_cache, f)
+        except OSError:
+            self.logger.debug("Could not persist step cache to %s", _STEP_CACHE_PATH)
+
+    @staticmethod
+    def _step_fingerprint(step: WorkflowStep, prompt: str, custom_prompt: str) -> str:
+        """Content-address a step by its fully substituted inputs."""
+        hasher = hashlib.sha256()
+        for part in (_STEP_CACHE_VERSION, prompt, step.type.value, custom_prompt, json.dumps(step.context, sort_keys=True, default=str)):
+            hasher.update(part.encode())
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _schedule_step_cache_flush(self) -> None:
+        """Mark the cache dirty and ensure a deferred flush is pending."""
+        self._step_cache_dirty = True
+        if self._step_cache_flush_task is None or self._step_cache_flush_task.done():
+            self._step_cache_flush_task = self._spawn(self._flush_step_cache_later())
+
+    async def _flush_step_cache_later(self) -> None:
+        """Write the cache once the current burst of completions settles."""
+        while self._step_cache_dirty:
+            # The flag drops only once the write is imminent, so a
+            # cancellation mid-sleep leaves it set for the shutdown flush
+            await asyncio.sleep(_STEP_CACHE_FLUSH_DELAY)
+            self._step_cache_dirty = False
+            await asyncio.get_running_loop().run_in_executor(None, self._write_step_cache)
+
+    async def _enqueue_checkpoint(self, execution: WorkflowExecution, step_index: int) -> None:
+        """Queue a checkpoint for the writer task, newest-wins.
+
+        If the queue is full the stale entry is dropped; with incremental
+        checkpoints the next write simply carries a larger delta.
+        """
+        if self._checkpoint_writer_task is None or self._checkpoint_writer_task.done():
+            self._checkpoint_writer_task = self._spawn(self._checkpoint_writer())
+
+        item = (execution, step_index)
+        try:
+            self._checkpoint_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                self._checkpoint_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._checkpoint_queue.put_nowait(item)
+
+    async def _checkpoint_writer(self) -> None:
+        """Drain the checkpoint queue, persisting one record at a time."""
+        while True:
+            execution, step_index = await self._checkpoint_queue.get()
+            try:
+                await self._persist_checkpoint(execution, step_index)
+            except Exception:
+                self.logger.exception("Checkpoint write failed at step %d", step_index)
+            finally:
+                self._checkpoint_queue.task_done()
+
+    async def _persist_checkpoint(self, execution: WorkflowExecution, step_index: int) -> None:
+        """Persist a checkpoint record (in-memory today, IO-ready hook)."""
+        execution.create_checkpoint(step_index)
+        self.logger.debug("Created checkpoint at step %d", step_index)
+
+    def _on_execution_done(self, execution_id: str, task: asyncio.Task) -> None:
+        """Release a finished execution task as soon as it completes.
+
+        Registered as a done callback, replacing the former five-minute
+        polling sweep: cleanup latency drops to the callback dispatch and
+        the engine does no periodic work at idle.
+        """
+        self.execution_tasks.pop(execution_id, None)
+
+        if task.cancelled():
+            self.logger.debug("Cleaned up cancelled task: %s", execution_id)
+            return
+
+        error = task.exception()
+        if error is not None:
+            self.logger.error("Execution task %s failed: %s", execution_id, error)
+
+            # Update execution status
+            execution = self.running_executions.get(execution_id)
+            if execution:
+                execution.status = WorkflowStatus.FAILED
+                execution.add_error("execution_engine", str(error))
+        else:
             self.logger.debug("Cleaned up finished task: %s", execution_id)
 
     async def execute_workflow(self, execution: WorkflowExecution, variables: dict[str, str] | None = None) -> ExecutionResult:
@@ -113,7 +275,7 @@ class WorkflowExecutionEngine:
 
                 # Initialize execution
                 execution.status = WorkflowStatus.RUNNING
-                execution.started_at = datetime.now(UTC)
+                execution.mark_started()
 
                 # Create Claude agent for this execution
                 claude_agent = await self._create_claude_agent(execution)
@@ -143,7 +305,7 @@ class WorkflowExecutionEngine:
             return ExecutionResult(
                 workflow_id=execution_id,
                 status=WorkflowStatus.FAILED,
-                steps_completed=len(execution.step_results),
+                steps_completed=execution.completed_count,
                 total_steps=len(execution.config.steps),
                 results=execution.step_results,
                 error_message=str(e),
@@ -174,6 +336,31 @@ class WorkflowExecutionEngine:
         """Execute workflow steps with dependency resolution."""
         workflow_steps = execution.config.to_workflow_steps()
 
+        if execution.config.allow_parallel and len(workflow_steps) > 1:
+            await self._execute_steps_parallel(execution, claude_agent, variables, workflow_steps)
+        else:
+            await self._execute_steps_sequential(execution, claude_agent, variables, workflow_steps)
+
+        # Create final result
+        return ExecutionResult(
+            workflow_id=execution.id,
+            status=execution.status,
+            steps_completed=execution.completed_count,
+            total_steps=len(workflow_steps),
+            results=execution.step_results,
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
+            execution_time=execution.get_execution_time(),
+        )
+
+    async def _execute_steps_sequential(
+        self,
+        execution: WorkflowExecution,
+        claude_agent: ClaudeAgent,
+        variables: dict[str, str],
+        workflow_steps: list[WorkflowStep],
+    ) -> None:
+        """Execute steps one at a time in declaration order."""
         completed_steps = set()
 
         step_index = 0
@@ -191,13 +378,12 @@ class WorkflowExecutionEngine:
                 result = await self._execute_step(step, claude_agent, variables, execution)
 
                 # Store result
-                execution.step_results[step.id] = result
+                execution.record_result(step.id, result)
                 completed_steps.add(step.id)
 
                 # Create checkpoint if needed
                 if step_index % execution.config.checkpoint_interval == 0:
-                    execution.create_checkpoint(step_index)
-                    self.logger.debug("Created checkpoint at step %d", step_index)
+                    await self._enqueue_checkpoint(execution, step_index)
 
                 step_index += 1
 
@@ -212,34 +398,75 @@ class WorkflowExecutionEngine:
                 # Try recovery strategies
                 recovery_result = await self._attempt_step_recovery(step, e, claude_agent, execution)
                 if recovery_result:
-                    execution.step_results[step.id] = recovery_result
+                    execution.record_result(step.id, recovery_result)
                     completed_steps.add(step.id)
                     execution.add_error(step.id, str(e), "recovered")
                 else:
                     self.logger.warning("Step %s recovery failed, continuing", step.id)
 
-        # Create final result
-        return ExecutionResult(
-            workflow_id=execution.id,
-            status=execution.status,
-            steps_completed=len(execution.step_results),
-            total_steps=len(workflow_steps),
-            results=execution.step_results,
-            started_at=execution.started_at,
-            completed_at=execution.completed_at,
-            execution_time=execution.get_execution_time(),
-        )
+    async def _execute_steps_parallel(
+        self,
+        execution: WorkflowExecution,
+        claude_agent: ClaudeAgent,
+        variables: dict[str, str],
+        workflow_steps: list[WorkflowStep],
+    ) -> None:
+        """Execute independent steps concurrently, level by dependency level.
+
+        Wall-clock time becomes proportional to the critical-path depth
+        instead of the total step count; overall concurrency is still
+        capped by the execution semaphore.
+        """
+        step_index = 0
+        for level in execution.config.topological_levels():
+            execution.current_step = step_index
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for step in level:
+                        tg.create_task(self._execute_tracked_step(step, claude_agent, variables, execution))
+            except* ExecutionEngineError as eg:
+                raise eg.exceptions[0] from None
+
+            step_index += len(level)
+
+            # Create checkpoint if needed
+            if step_index % execution.config.checkpoint_interval == 0:
+                await self._enqueue_checkpoint(execution, step_index)
+
+    async def _execute_tracked_step(
+        self,
+        step: WorkflowStep,
+        claude_agent: ClaudeAgent,
+        variables: dict[str, str],
+        execution: WorkflowExecution,
+    ) -> None:
+        """Run one step and record its result, applying the error policy."""
+        try:
+            self.logger.info("Executing step: %s (%s)", step.id, step.type.value)
+            result = await self._execute_step(step, claude_agent, variables, execution)
+            execution.record_result(step.id, result)
+
+        except Exception as e:
+            self.logger.exception("Step %s failed", step.id)
+            execution.add_error(step.id, str(e))
+
+            if not execution.config.continue_on_error:
+                raise ExecutionEngineError(f"Step {step.id} failed: {e}")
+
+            recovery_result = await self._attempt_step_recovery(step, e, claude_agent, execution)
+            if recovery_result:
+                execution.record_result(step.id, recovery_result)
+                execution.add_error(step.id, str(e), "recovered")
+            else:
+                self.logger.warning("Step %s recovery failed, continuing", step.id)
 
     def _build_dependency_graph(self, steps: list[WorkflowStep]) -> dict[str, list[str]]:
         """Build step dependency graph."""
-        dependencies = {}
-        for step in steps:
-            dependencies[step.id] = step.dependencies.copy()
-        return dependencies
+        return {step.id: set(step.dependencies) for step in steps}
 
     def _dependencies_satisfied(self, step: WorkflowStep, completed_steps: set) -> bool:
         """Check if step dependencies are satisfied."""
-        return all(dep in completed_steps for dep in step.dependencies)
+        return step.dependencies.issubset(completed_steps)
 
     async def _execute_step(self, step: WorkflowStep, claude_agent: ClaudeAgent, variables: dict[str, str], execution: WorkflowExecution) -> str:
         """Execute individual workflow step."""
@@ -247,27 +474,31 @@ class WorkflowExecutionEngine:
         prompt = self._apply_variables(step.prompt, variables)
 
         # Determine custom prompt based on step type
-        custom_prompts = {
-            StepType.ANALYSIS: "Perform detailed analysis with comprehensive insights. Focus on providing actionable recommendations.",
-            StepType.IMPLEMENTATION: "Implement following best practices and conventions. Ensure code quality and maintainability.",
-            StepType.TESTING: "Create thorough tests with good coverage. Include edge cases and error scenarios.",
-            StepType.DEPLOYMENT: "Prepare for production deployment with safety checks and rollback plans.",
-            StepType.GENERAL: "Execute the requested task with attention to detail and best practices.",
-        }
+        custom_prompt = _CUSTOM_PROMPTS.get(step.type, _DEFAULT_CUSTOM_PROMPT)
 
-        custom_prompt = custom_prompts.get(step.type, custom_prompts[StepType.GENERAL])
-
-        # Add context information to prompt if available
+        # Add context information to prompt if available; the joined
+        # block is cached by content, so identity reuse is irrelevant
+        # and the cache stays bounded
         if step.context:
-            context_str = "\n".join(f"- {k}: {v}" for k, v in step.context.items())
+            context_str = _format_context(tuple((str(k), str(v)) for k, v in step.context.items()))
             prompt = f"{prompt}\n\nContext:\n{context_str}"
 
+        # Skip the Claude call when an identical step already produced a result
+        fingerprint = self._step_fingerprint(step, prompt, custom_prompt)
+        cached = self._step_cache.get(fingerprint)
+        if cached is not None:
+            self.logger.info("Step %s served from result cache", step.id)
+            return cached
+
         try:
             # Execute through Claude CLI with timeout
             timeout = step.timeout or 300  # Default 5 minutes
 
             result = await asyncio.wait_for(self._run_claude_step(claude_agent, prompt, custom_prompt), timeout=timeout)
 
+            self._step_cache[fingerprint] = result
+            self._schedule_step_cache_flush()
+
             return result
 
         except TimeoutError:
@@ -277,11 +508,11 @@ class WorkflowExecutionEngine:
 
     async def _run_claude_step(self, claude_agent: ClaudeAgent, prompt: str, custom_prompt: str) -> str:
         """Run Claude step in executor to avoid blocking."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        # Run in thread executor to avoid blocking the event loop
+        # Run in the engine's executor to avoid blocking the event loop
         result = await loop.run_in_executor(
-            None,
+            self._claude_executor,
             claude_agent.claude_tool._run,
             prompt,
             True,  # continue_session
@@ -292,10 +523,13 @@ class WorkflowExecutionEngine:
 
     def _apply_variables(self, text: str, variables: dict[str, str]) -> str:
         """Apply variable substitution to text."""
-        for key, value in variables.items():
-            text = text.replace(f"{{{key}}}", value)
-            text = text.replace(f"${{{key}}}", value)
-        return text
+        if not variables:
+            return text
+        keys = tuple(sorted(variables))
+        if len(keys) <= _CODEGEN_MAX_KEYS:
+            return _substituter(keys)(text, variables)
+        pattern = _variable_pattern(keys)
+        return pattern.sub(lambda match: variables[match.group(1)], text)
 
     async def _attempt_step_recovery(self, step: WorkflowStep, error: Exception, claude_agent: ClaudeAgent, execution: WorkflowExecution) -> str | None:
         """Attempt to recover from step failure."""
@@ -338,9 +572,10 @@ class WorkflowExecutionEngine:
         execution_id = execution.id
 
         # Create background task
-        task = asyncio.create_task(self.execute_workflow(execution, variables))
+        task = self._spawn(self.execute_workflow(execution, variables))
 
         self.execution_tasks[execution_id] = task
+        task.add_done_callback(lambda t, eid=execution_id: self._on_execution_done(eid, t))
         self.logger.info("Started background execution: %s", execution_id)
 
         return execution_id
@@ -365,6 +600,13 @@ class WorkflowExecutionEngine:
 
         try:
             task.cancel()
+            # Await the cancellation so the task releases its frames and
+            # callbacks now instead of lingering until the periodic sweep
+            try:
+                await asyncio.wait_for(task, timeout=5)
+            except (asyncio.CancelledError, Exception):  # noqa: S110
+                pass
+            self.execution_tasks.pop(execution_id, None)
             execution.status = WorkflowStatus.CANCELLED
             self.logger.info("Cancelled execution: %s", execution_id)
             return True
@@ -385,14 +627,6 @@ class WorkflowExecutionEngine:
         """Shutdown execution engine and cleanup resources."""
         self.logger.info("Shutting down workflow execution engine")
 
-        # Cancel cleanup task
-        if self.cleanup_task and not self.cleanup_task.done():
-            self.cleanup_task.cancel()
-            try:
-                await self.cleanup_task
-            except asyncio.CancelledError:
-                pass
-
         # Cancel all running executions
         for execution_id in list(self.execution_tasks.keys()):
             await self.cancel_execution(execution_id)
@@ -401,6 +635,29 @@ class WorkflowExecutionEngine:
         if self.execution_tasks:
             await asyncio.gather(*self.execution_tasks.values(), return_exceptions=True)
 
+        # Stop the checkpoint writer after draining pending records
+        if self._checkpoint_writer_task and not self._checkpoint_writer_task.done():
+            await self._checkpoint_queue.join()
+            self._checkpoint_writer_task.cancel()
+            try:
+                await self._checkpoint_writer_task
+            except asyncio.CancelledError:
+                pass
+
+        # Flush any step results the debounced writer has not persisted
+        if self._step_cache_flush_task and not self._step_cache_flush_task.done():
+            self._step_cache_flush_task.cancel()
+            try:
+                await self._step_cache_flush_task
+            except asyncio.CancelledError:
+                pass
+        if self._step_cache_dirty:
+            self._step_cache_dirty = False
+            self._write_step_cache()
+
+        # Stop the Claude step pool, abandoning queued work
+        self._claude_executor.shutdown(wait=True, cancel_futures=True)
+
         # Clear state
         self.running_executions.clear()
         self.execution_tasks.clear()
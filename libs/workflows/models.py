@@ -1,5 +1,8 @@
 """Data models for LangChain workflow integration."""
 
+import collections
+import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -7,7 +10,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
 
 
 class WorkflowStatus(Enum):
@@ -31,7 +36,7 @@ class StepType(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowStep:
     """Individual workflow step configuration."""
 
@@ -41,20 +46,33 @@ class WorkflowStep:
     context: dict[str, Any] = field(default_factory=dict)
     timeout: int | None = None
     retry_count: int = 3
-    dependencies: list[str] = field(default_factory=list)
+    dependencies: frozenset[str] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        # Accept lists from step configs but store a frozenset so
+        # dependency checks are single C-level set operations
+        if not isinstance(self.dependencies, frozenset):
+            object.__setattr__(self, "dependencies", frozenset(self.dependencies))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutionCheckpoint:
-    """Checkpoint data for workflow execution."""
+    """Incremental checkpoint data for workflow execution.
+
+    Each checkpoint stores only the step results added since its parent;
+    the full state at a checkpoint is reconstructed by walking the parent
+    chain. This keeps total checkpoint work linear in the number of steps
+    instead of quadratic.
+    """
 
     step_index: int
-    results: dict[str, Any]
+    delta_results: dict[str, Any]
     timestamp: datetime
+    parent_step_index: int | None = None
     session_state: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result from workflow execution."""
 
@@ -93,8 +111,15 @@ class WorkflowConfig(BaseModel):
     continue_on_error: bool = Field(default=False, description="Continue execution on step failure")
     recovery_strategies: list[str] = Field(default_factory=lambda: ["retry", "skip", "prompt"], description="Error recovery strategies")
 
+    # Memoized conversion; step configs do not change after load, so the
+    # dict-to-dataclass build runs once per config instead of per execution
+    _cached_steps: list[WorkflowStep] | None = PrivateAttr(default=None)
+
     def to_workflow_steps(self) -> list[WorkflowStep]:
         """Convert steps configuration to WorkflowStep objects."""
+        if self._cached_steps is not None:
+            return self._cached_steps
+
         workflow_steps = []
 
         for step_data in self.steps:
@@ -109,43 +134,117 @@ class WorkflowConfig(BaseModel):
             )
             workflow_steps.append(step)
 
+        self._cached_steps = workflow_steps
         return workflow_steps
 
-
-@dataclass
+    # Cached dependency levels; like the step list, the graph is static
+    # per config, so Kahn's algorithm runs once instead of per execution
+    _cached_dep_levels: list[list[WorkflowStep]] | None = PrivateAttr(default=None)
+
+    def topological_levels(self) -> list[list[WorkflowStep]]:
+        """Group steps into dependency levels via Kahn's algorithm.
+
+        Steps in the same level have no dependencies on each other and can
+        run concurrently. Steps caught in a dependency cycle are dropped
+        with a warning.
+
+        Returns:
+            Levels in execution order
+        """
+        if self._cached_dep_levels is not None:
+            return self._cached_dep_levels
+
+        steps = self.to_workflow_steps()
+        known = {step.id for step in steps}
+        remaining = {step.id: {dep for dep in step.dependencies if dep in known} for step in steps}
+        by_id = {step.id: step for step in steps}
+
+        levels: list[list[WorkflowStep]] = []
+        while remaining:
+            ready = [step_id for step_id, deps in remaining.items() if not deps]
+            if not ready:
+                logger.warning("Dependency cycle among steps, skipping: %s", sorted(remaining))
+                break
+            levels.append([by_id[step_id] for step_id in ready])
+            for step_id in ready:
+                del remaining[step_id]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        self._cached_dep_levels = levels
+        return levels
+
+
+@dataclass(slots=True)
 class WorkflowExecution:
     """Active workflow execution state."""
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    template_id: str | None = None
     config: WorkflowConfig = field(default=None)
     status: WorkflowStatus = WorkflowStatus.PENDING
     current_step: int | None = None
+    context: dict[str, Any] = field(default_factory=dict)
 
     # Execution tracking
+    created_at: datetime | None = field(default_factory=lambda: datetime.now(UTC))
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
     # Results and state
     step_results: dict[str, Any] = field(default_factory=dict)
     checkpoints: dict[int, ExecutionCheckpoint] = field(default_factory=dict)
-    error_log: list[dict[str, Any]] = field(default_factory=list)
+    # Bounded so a flaky long-running workflow cannot grow the log without
+    # limit; the oldest entries are evicted first
+    error_log: collections.deque[dict[str, Any]] = field(default_factory=lambda: collections.deque(maxlen=1000))
 
     # Session management
     claude_session_id: str | None = None
     project_path: Path | None = None
 
+    # Running count of recorded results; keeps progress polling O(1)
+    # instead of re-measuring the result dict on every call
+    _completed_count: int = field(default=0, init=False, repr=False)
+
+    # Incremental checkpoint bookkeeping
+    _last_checkpoint_keys: set[str] = field(default_factory=set, init=False, repr=False)
+    _last_checkpoint_index: int | None = field(default=None, init=False, repr=False)
+
+    # Monotonic start reference; wall-clock started_at stays for display
+    # while durations come from a clock immune to NTP adjustments
+    _started_monotonic: float | None = field(default=None, init=False, repr=False)
+
+    @property
+    def completed_count(self) -> int:
+        """Number of step results recorded so far."""
+        return self._completed_count
+
+    def record_result(self, step_id: str, result: Any) -> None:
+        """Store a step result and keep the completed counter in sync."""
+        if step_id not in self.step_results:
+            self._completed_count += 1
+        self.step_results[step_id] = result
+
     def get_progress(self) -> float:
         """Get execution progress as percentage."""
         if not self.config or not self.config.steps:
             return 0.0
 
-        completed_steps = len(self.step_results)
-        total_steps = len(self.config.steps)
+        return (self._completed_count / len(self.config.steps)) * 100.0
 
-        return (completed_steps / total_steps) * 100.0
+    def mark_started(self) -> None:
+        """Record wall-clock and monotonic start times."""
+        self.started_at = datetime.now(UTC)
+        self._started_monotonic = time.monotonic()
 
     def get_execution_time(self) -> float | None:
         """Get total execution time in seconds."""
+        if self._started_monotonic is not None:
+            if self.completed_at is None:
+                return time.monotonic() - self._started_monotonic
+            # Completed runs fall through to the wall-clock delta so the
+            # reported duration matches the recorded timestamps
+
         if not self.started_at:
             return None
 
@@ -158,9 +257,41 @@ class WorkflowExecution:
         self.error_log.append(error_entry)
 
     def create_checkpoint(self, step_index: int, session_state: dict[str, Any] | None = None) -> None:
-        """Create execution checkpoint."""
-        checkpoint = ExecutionCheckpoint(step_index=step_index, results=self.step_results.copy(), timestamp=datetime.now(UTC), session_state=session_state or {})
+        """Create an incremental execution checkpoint."""
+        delta = {key: value for key, value in self.step_results.items() if key not in self._last_checkpoint_keys}
+        checkpoint = ExecutionCheckpoint(
+            step_index=step_index,
+            delta_results=delta,
+            timestamp=datetime.now(UTC),
+            parent_step_index=self._last_checkpoint_index,
+            session_state=session_state or {},
+        )
         self.checkpoints[step_index] = checkpoint
+        self._last_checkpoint_keys.update(delta)
+        self._last_checkpoint_index = step_index
+
+    def restore_checkpoint_results(self, step_index: int) -> dict[str, Any]:
+        """Reconstruct the full step results at a checkpoint.
+
+        Walks the parent chain and merges deltas oldest-first.
+
+        Args:
+            step_index: Index of the checkpoint to reconstruct
+
+        Returns:
+            Combined step results up to and including the checkpoint
+        """
+        chain: list[ExecutionCheckpoint] = []
+        index: int | None = step_index
+        while index is not None:
+            checkpoint = self.checkpoints[index]
+            chain.append(checkpoint)
+            index = checkpoint.parent_step_index
+
+        results: dict[str, Any] = {}
+        for checkpoint in reversed(chain):
+            results.update(checkpoint.delta_results)
+        return results
 
 
 class WorkflowTemplate(BaseModel):
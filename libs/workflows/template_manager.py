@@ -4,16 +4,63 @@ This module manages workflow templates for LangChain-based automation workflows.
 Templates are loaded from user and project-specific directories.
 """
 
+import concurrent.futures
+import functools
+import json
 import logging
+import os
+import tempfile
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    # Optional: orjson serializes/deserializes JSON in Rust, several
+    # times faster than the stdlib module for the sidecar cache below
+    import orjson
+except ImportError:
+    orjson = None
 
 from libs.core.error_handling import ErrorCategory, YesmanError
 from libs.workflows.models import WorkflowConfig
 
+# Built-in templates shipped with the package (lowest precedence)
+_BUILTIN_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Minimum spacing between directory-mtime probes; hot polling paths hit
+# a single monotonic clock read instead of one stat per directory
+_MTIME_CHECK_INTERVAL = 1.0
+
+
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use and pick its fastest safe loader.
+
+    The yaml import is a noticeable slice of cold start, and most code
+    paths that construct the service never touch a template file; the
+    cache makes later calls a plain dict lookup. Prefers the libyaml
+    CSafeLoader/CSafeDumper (requires PyYAML built against libyaml),
+    which parse and emit far faster than the pure-Python variants with
+    identical safety.
+    """
+    import yaml
+
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader), getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_config_cached(file_path: str, mtime_ns: int) -> WorkflowConfig:
+    """Parse and validate a template's workflow configuration.
+
+    Keyed by (path, mtime_ns): when the file changes its key changes with
+    it, so stale entries simply fall out of the LRU — no explicit purge.
+    """
+    yaml, loader, _ = _yaml()
+    with open(file_path, "rb") as f:
+        yaml_content = yaml.load(f.read(), Loader=loader)  # noqa: S506
+    return WorkflowConfig(**yaml_content.get("workflow", {}))
+
 
 class TemplateManagerError(YesmanError):
     """Template manager specific error."""
@@ -36,43 +83,47 @@ class WorkflowTemplateManager:
         # Template directories (in order of precedence)
         self.template_dirs = []
 
+        # Home and cwd are resolved once; every later operation reuses
+        # these instead of re-issuing the underlying syscalls
+        self._user_template_dir = Path.home() / ".scripton" / "yesman" / "workflows"
+        self._project_template_dir = Path.cwd() / ".scripton" / "yesman" / "workflows"
+
+        # Candidate directories are appended without exists() pre-checks;
+        # the scan itself tolerates missing directories, so existence is
+        # verified exactly where each directory is used (and a directory
+        # created after construction is picked up automatically)
+
         # User-specific templates (highest precedence)
-        user_template_dir = Path.home() / ".scripton" / "yesman" / "workflows"
-        if user_template_dir.exists():
-            self.template_dirs.append(user_template_dir)
+        self.template_dirs.append(self._user_template_dir)
 
         # Project-specific templates
-        project_template_dir = Path.cwd() / ".scripton" / "yesman" / "workflows"
-        if project_template_dir.exists():
-            self.template_dirs.append(project_template_dir)
+        self.template_dirs.append(self._project_template_dir)
 
         # Custom base directory
-        if base_template_dir and base_template_dir.exists():
+        if base_template_dir:
             self.template_dirs.append(base_template_dir)
 
         # Built-in templates (lowest precedence)
-        builtin_template_dir = Path(__file__).parent / "templates"
-        self.template_dirs.append(builtin_template_dir)
+        self.template_dirs.append(_BUILTIN_TEMPLATE_DIR)
 
-        # Template cache
+        # Template cache, invalidated by directory mtime rather than a
+        # fixed TTL: steady-state refresh checks cost one stat per
+        # directory instead of a periodic full rescan
         self._template_cache: dict[str, dict[str, Any]] = {}
-        self._cache_timestamp: datetime | None = None
-        self._cache_ttl = 300  # 5 minutes
+        self._cache_primed = False
+        self._dir_mtimes: dict[str, int] = {}
+        # path -> (mtime_ns, parsed data); unchanged files skip re-parsing
+        self._parsed_files: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._last_mtime_check = 0.0
 
         self.logger.info(f"Template manager initialized with directories: {[str(d) for d in self.template_dirs]}")
 
     def create_template_directories(self) -> None:
         """Create template directories if they don't exist."""
-        user_template_dir = Path.home() / ".scripton" / "yesman" / "workflows"
-        project_template_dir = Path.cwd() / ".scripton" / "yesman" / "workflows"
-
-        for template_dir in [user_template_dir, project_template_dir]:
+        for template_dir in [self._user_template_dir, self._project_template_dir]:
             template_dir.mkdir(parents=True, exist_ok=True)
             self.logger.debug(f"Created template directory: {template_dir}")
 
-            if template_dir not in self.template_dirs:
-                self.template_dirs.insert(0, template_dir)
-
     def list_templates(self, refresh_cache: bool = False) -> dict[str, dict[str, Any]]:
         """List all available workflow templates.
 
@@ -116,18 +167,11 @@ class WorkflowTemplateManager:
             return None
 
         try:
-            # Load the actual YAML file
+            # One stat keys the LRU; repeated starts of the same template
+            # skip the YAML parse and Pydantic validation entirely
             template_path = template_data["file_path"]
-            with open(template_path, encoding="utf-8") as f:
-                yaml_content = yaml.safe_load(f)
-
-            # Extract workflow configuration
-            workflow_config = yaml_content.get("workflow", {})
-
-            # Create WorkflowConfig with validation
-            config = WorkflowConfig(**workflow_config)
-
-            return config
+            mtime_ns = os.stat(template_path).st_mtime_ns
+            return _load_config_cached(template_path, mtime_ns)
 
         except Exception as e:
             self.logger.exception(f"Failed to load template config for {template_id}")
@@ -149,10 +193,7 @@ class WorkflowTemplateManager:
         """
         try:
             # Determine save location
-            if user_template:
-                template_dir = Path.home() / ".scripton" / "yesman" / "workflows"
-            else:
-                template_dir = Path.cwd() / ".scripton" / "yesman" / "workflows"
+            template_dir = self._user_template_dir if user_template else self._project_template_dir
 
             template_dir.mkdir(parents=True, exist_ok=True)
             template_path = template_dir / f"{template_id}.yaml"
@@ -160,9 +201,10 @@ class WorkflowTemplateManager:
             # Add metadata
             full_template = {"metadata": {"id": template_id, "created_at": datetime.now(UTC).isoformat(), "version": "1.0"}, **template_data}
 
-            # Save to file
+            # Save to file through the C emitter when available
+            yaml, _, dumper = _yaml()
             with open(template_path, "w", encoding="utf-8") as f:
-                yaml.dump(full_template, f, default_flow_style=False, indent=2)
+                yaml.dump(full_template, f, Dumper=dumper, default_flow_style=False, indent=2, sort_keys=False)
 
             # Refresh cache
             self._refresh_template_cache()
@@ -196,10 +238,7 @@ class WorkflowTemplateManager:
             template_path = Path(template_data["file_path"])
 
             # Verify it's in the expected location
-            if user_template:
-                expected_dir = Path.home() / ".scripton" / "yesman" / "workflows"
-            else:
-                expected_dir = Path.cwd() / ".scripton" / "yesman" / "workflows"
+            expected_dir = self._user_template_dir if user_template else self._project_template_dir
 
             if not template_path.parent == expected_dir:
                 raise TemplateManagerError(f"Template '{template_id}' is not in expected location")
@@ -237,19 +276,26 @@ class WorkflowTemplateManager:
 
             # Validate metadata
             metadata = template_data.get("metadata", {})
-            if not metadata.get("name"):
+            if not isinstance(metadata, dict) or not metadata.get("name"):
                 errors.append("Missing template name in metadata")
 
             # Validate workflow configuration
             workflow_config = template_data.get("workflow", {})
-            if not workflow_config.get("steps"):
+            if not isinstance(workflow_config, dict):
+                errors.append("Workflow section must be a mapping")
+            elif not workflow_config.get("steps"):
                 errors.append("Workflow must have at least one step")
-
-            # Try to create WorkflowConfig to validate structure
-            try:
-                WorkflowConfig(**workflow_config)
-            except Exception as e:
-                errors.append(f"Invalid workflow configuration: {e}")
+            elif not isinstance(workflow_config["steps"], list) or not all(isinstance(step, dict) for step in workflow_config["steps"]):
+                errors.append("Workflow steps must be a list of mappings")
+
+            # Full model validation is the expensive part; obviously
+            # malformed templates are rejected by the cheap checks above
+            # without ever building the Pydantic tree
+            if not errors:
+                try:
+                    WorkflowConfig(**workflow_config)
+                except Exception as e:
+                    errors.append(f"Invalid workflow configuration: {e}")
 
         except Exception as e:
             errors.append(f"Template validation failed: {e}")
@@ -284,52 +330,152 @@ class WorkflowTemplateManager:
         return template_data
 
     def _should_refresh_cache(self) -> bool:
-        """Check if template cache should be refreshed."""
-        if not self._cache_timestamp:
+        """Check if template cache should be refreshed.
+
+        Compares each template directory's mtime against the value seen
+        at the last refresh; creates, deletes, and renames bump it, so
+        unchanged trees never trigger a rescan. Rewriting an existing
+        file in place does not touch the directory mtime — save_template
+        goes through an atomic replace (a rename), which does, but an
+        out-of-band in-place edit is only noticed after some other
+        create/delete/rename in that directory.
+        """
+        if not self._cache_primed:
             return True
 
-        elapsed = (datetime.now(UTC) - self._cache_timestamp).total_seconds()
-        return elapsed > self._cache_ttl
+        # time.monotonic is a plain clock read, far cheaper than the
+        # stat probes below and immune to wall-clock adjustments
+        now = time.monotonic()
+        if now - self._last_mtime_check < _MTIME_CHECK_INTERVAL:
+            return False
+        self._last_mtime_check = now
+
+        for template_dir in self.template_dirs:
+            try:
+                mtime_ns = os.stat(template_dir).st_mtime_ns
+            except OSError:
+                mtime_ns = -1
+            if self._dir_mtimes.get(str(template_dir)) != mtime_ns:
+                return True
+
+        return False
 
     def _refresh_template_cache(self) -> None:
-        """Refresh the template cache by scanning directories."""
+        """Refresh the template cache by scanning directories.
+
+        Directories are scanned concurrently (each scan is dominated by
+        open + parse I/O) into per-directory results, then merged in
+        precedence order. The shared caches are swapped in with single
+        assignments so concurrent readers never observe a half-built
+        state.
+        """
         self.logger.debug("Refreshing template cache")
-        self._template_cache.clear()
+        previous_parsed = self._parsed_files
 
-        for template_dir in self.template_dirs:
-            if not template_dir.exists():
-                continue
+        scan_dirs = self.template_dirs
 
+        def scan(template_dir: Path) -> tuple[dict[str, dict[str, Any]], dict[str, tuple[int, dict[str, Any]]]]:
             try:
-                self._scan_template_directory(template_dir)
+                return self._scan_template_directory(template_dir, previous_parsed)
             except Exception as e:
                 self.logger.warning(f"Failed to scan template directory {template_dir}: {e}")
-
-        self._cache_timestamp = datetime.now(UTC)
+                return {}, {}
+
+        if len(scan_dirs) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(scan_dirs))) as pool:
+                results = list(pool.map(scan, scan_dirs))
+        else:
+            results = [scan(d) for d in scan_dirs]
+
+        new_cache: dict[str, dict[str, Any]] = {}
+        new_parsed: dict[str, tuple[int, dict[str, Any]]] = {}
+        dir_mtimes: dict[str, int] = {str(d): -1 for d in self.template_dirs}
+        for template_dir, (templates, parsed) in zip(scan_dirs, results, strict=True):
+            for template_id, template_data in templates.items():
+                # Earlier directories have higher precedence
+                new_cache.setdefault(template_id, template_data)
+            new_parsed.update(parsed)
+
+            # Recorded after the scan so sidecar writes during it do not
+            # immediately re-dirty the directory
+            try:
+                dir_mtimes[str(template_dir)] = os.stat(template_dir).st_mtime_ns
+            except OSError:
+                pass
+
+        self._template_cache = new_cache
+        self._parsed_files = new_parsed
+        self._dir_mtimes = dir_mtimes
+        self._cache_primed = True
         self.logger.debug(f"Template cache refreshed with {len(self._template_cache)} templates")
 
-    def _scan_template_directory(self, template_dir: Path) -> None:
-        """Scan directory for template YAML files."""
-        for yaml_file in template_dir.glob("*.yaml"):
-            try:
-                template_data = self._load_template_file(yaml_file)
-                if template_data:
-                    template_id = template_data["metadata"].get("id", yaml_file.stem)
+    def _scan_template_directory(
+        self,
+        template_dir: Path,
+        previous_parsed: dict[str, tuple[int, dict[str, Any]]] | None = None,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, tuple[int, dict[str, Any]]]]:
+        """Scan one directory for template YAML files.
 
-                    # Don't overwrite higher precedence templates
-                    if template_id not in self._template_cache:
-                        template_data["file_path"] = str(yaml_file)
-                        template_data["source_dir"] = str(template_dir)
-                        self._template_cache[template_id] = template_data
+        Uses os.scandir rather than Path.glob: DirEntry carries the file
+        type from the directory listing itself, so enumeration needs no
+        per-file stat call and no intermediate Path objects. Files whose
+        mtime matches ``previous_parsed`` reuse the prior parsed data.
 
-            except Exception as e:
-                self.logger.warning(f"Failed to load template {yaml_file}: {e}")
+        Returns:
+            (templates keyed by id, parsed-file cache entries) for this
+            directory only; the caller merges across directories.
+        """
+        templates: dict[str, dict[str, Any]] = {}
+        parsed: dict[str, tuple[int, dict[str, Any]]] = {}
 
-    def _load_template_file(self, yaml_file: Path) -> dict[str, Any] | None:
-        """Load and validate template YAML file."""
         try:
-            with open(yaml_file, encoding="utf-8") as f:
-                template_data = yaml.safe_load(f)
+            entries_iter = os.scandir(template_dir)
+        except FileNotFoundError:
+            # Directory not created (yet); nothing to scan
+            return templates, parsed
+
+        with entries_iter as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                    cached = previous_parsed.get(entry.path) if previous_parsed else None
+                    if cached is not None and cached[0] == mtime_ns:
+                        template_data = cached[1]
+                    else:
+                        template_data = self._load_template_file(entry.path)
+                    if template_data:
+                        parsed[entry.path] = (mtime_ns, template_data)
+                        template_id = template_data["metadata"].get("id", entry.name[: -len(".yaml")])
+
+                        if template_id not in templates:
+                            template_data["file_path"] = entry.path
+                            template_data["source_dir"] = str(template_dir)
+                            templates[template_id] = template_data
+
+                except Exception as e:
+                    self.logger.warning(f"Failed to load template {entry.path}: {e}")
+
+        return templates, parsed
+
+    def _load_template_file(self, yaml_file: str | Path) -> dict[str, Any] | None:
+        """Load and validate template YAML file.
+
+        A JSON sidecar written after the first parse lets later cold
+        starts skip the YAML parser entirely; the sidecar is ignored
+        whenever the YAML file is newer, so user edits always win.
+        """
+        try:
+            template_data = self._read_sidecar_cache(str(yaml_file))
+            from_sidecar = template_data is not None
+
+            if template_data is None:
+                # Bytes in, decoded by the YAML scanner itself (in C on
+                # the libyaml loader) — avoids a separate text-decode pass
+                yaml, loader, _ = _yaml()
+                with open(yaml_file, "rb") as f:
+                    template_data = yaml.load(f.read(), Loader=loader)  # noqa: S506
 
             if not isinstance(template_data, dict):
                 self.logger.warning(f"Template {yaml_file} is not a valid YAML object")
@@ -344,8 +490,55 @@ class WorkflowTemplateManager:
                 self.logger.warning(f"Template {yaml_file} missing workflow section")
                 return None
 
+            if not from_sidecar:
+                self._write_sidecar_cache(str(yaml_file), template_data)
+
             return template_data
 
         except Exception as e:
             self.logger.warning(f"Failed to parse template {yaml_file}: {e}")
             return None
+
+    def _read_sidecar_cache(self, yaml_file: str) -> dict[str, Any] | None:
+        """Return sidecar-cached template data if newer than the YAML."""
+        sidecar = yaml_file + ".cache.json"
+        try:
+            if os.stat(sidecar).st_mtime_ns < os.stat(yaml_file).st_mtime_ns:
+                return None
+            with open(sidecar, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_sidecar_cache(self, yaml_file: str, template_data: dict[str, Any]) -> None:
+        """Persist parsed template data next to its YAML file (best effort).
+
+        Written atomically via tempfile+rename. Data that does not
+        round-trip through JSON unchanged (e.g. YAML timestamps) raises
+        TypeError and is simply not cached, so the sidecar never alters
+        template value types.
+        """
+        # Never write into the packaged built-in templates; the install
+        # location may be read-only and generated files do not belong
+        # alongside shipped sources
+        if Path(yaml_file).parent == _BUILTIN_TEMPLATE_DIR:
+            return
+
+        sidecar = yaml_file + ".cache.json"
+        try:
+            if orjson is not None:
+                raw = orjson.dumps(template_data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            else:
+                raw = json.dumps(template_data).encode()
+        except TypeError:
+            return
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar) or ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            self.logger.debug("Could not write template cache %s", sidecar)
@@ -1,16 +1,28 @@
 """Workflow service for managing LangChain workflow executions."""
 
+from __future__ import annotations
+
+import heapq
 import logging
 import uuid
 from datetime import UTC, datetime
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from libs.core.error_handling import ErrorCategory, YesmanError
-from libs.workflows.execution_engine import WorkflowExecutionEngine
 from libs.workflows.models import WorkflowConfig, WorkflowExecution, WorkflowStatus
 from libs.workflows.template_manager import WorkflowTemplateManager
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    # The engine module pulls in the LangChain stack; the service only
+    # names it in annotations, so the import stays type-checking-only
+    from libs.workflows.execution_engine import WorkflowExecutionEngine
+
+
+# Statuses an execution cannot leave; only these feed the cleanup heap
+_TERMINAL_STATUSES = frozenset({WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED})
+
 
 class WorkflowServiceError(YesmanError):
     """Workflow service specific errors."""
@@ -25,6 +37,15 @@ class WorkflowService:
     def __init__(self, execution_engine: WorkflowExecutionEngine, template_manager: WorkflowTemplateManager | None = None) -> None:
         self.execution_engine = execution_engine
         self.executions: dict[str, WorkflowExecution] = {}
+        # Status buckets plus a creation-ordered id list; listing reads
+        # these instead of sorting every execution object on each call
+        self._by_status: dict[WorkflowStatus, dict[str, None]] = {status: {} for status in WorkflowStatus}
+        self._status_seen: dict[str, WorkflowStatus] = {}
+        self._created_order: list[str] = []
+        # id -> (change key, built snapshot); see get_execution_status
+        self._status_snapshots: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        # (completion time, id) min-heap consumed by cleanup
+        self._completion_heap: list[tuple[datetime, str]] = []
         self.template_manager = template_manager or WorkflowTemplateManager()
         self.logger = logging.getLogger("yesman.workflows.service")
 
@@ -63,6 +84,9 @@ class WorkflowService:
 
         # Store execution
         self.executions[execution.id] = execution
+        self._created_order.append(execution.id)
+        self._by_status[execution.status][execution.id] = None
+        self._status_seen[execution.id] = execution.status
 
         try:
             # Start execution
@@ -72,7 +96,7 @@ class WorkflowService:
 
         except Exception as e:
             # Remove failed execution
-            self.executions.pop(execution.id, None)
+            self._discard_execution(execution.id)
             raise WorkflowServiceError(f"Failed to start workflow: {e}")
 
     def get_execution(self, execution_id: str) -> WorkflowExecution | None:
@@ -80,14 +104,52 @@ class WorkflowService:
         return self.executions.get(execution_id)
 
     def list_executions(self, status_filter: WorkflowStatus | None = None) -> list[WorkflowExecution]:
-        """List all workflow executions."""
-        executions = list(self.executions.values())
-
-        if status_filter:
-            executions = [e for e in executions if e.status == status_filter]
-
-        # Sort by creation time, most recent first
-        return sorted(executions, key=lambda e: e.created_at, reverse=True)
+        """List workflow executions, most recently created first.
+
+        Creation order is append order (ids are created with a current
+        timestamp), so no per-call sort is needed; a status filter reads
+        the index bucket instead of touching every execution.
+        """
+        # Prune ids of removed executions once they dominate the list
+        if len(self._created_order) > 2 * len(self.executions):
+            self._created_order = [eid for eid in self._created_order if eid in self.executions]
+
+        if status_filter is None:
+            return [self.executions[eid] for eid in reversed(self._created_order) if eid in self.executions]
+
+        self._reconcile_status_index()
+        bucket = self._by_status[status_filter]
+        return [self.executions[eid] for eid in reversed(self._created_order) if eid in bucket]
+
+    def _set_status(self, execution: WorkflowExecution, status: WorkflowStatus) -> None:
+        """Transition an execution's status, keeping the index in step."""
+        seen = self._status_seen.get(execution.id)
+        if seen is not None:
+            self._by_status[seen].pop(execution.id, None)
+        execution.status = status
+        self._by_status[status][execution.id] = None
+        self._status_seen[execution.id] = status
+        if status in _TERMINAL_STATUSES:
+            heapq.heappush(self._completion_heap, (execution.completed_at or datetime.now(UTC), execution.id))
+
+    def _discard_execution(self, execution_id: str) -> None:
+        """Drop an execution from the store and its index entries."""
+        self.executions.pop(execution_id, None)
+        self._status_snapshots.pop(execution_id, None)
+        seen = self._status_seen.pop(execution_id, None)
+        if seen is not None:
+            self._by_status[seen].pop(execution_id, None)
+
+    def _reconcile_status_index(self) -> None:
+        """Re-home executions whose status changed outside _set_status.
+
+        The execution engine mutates execution.status directly; one pass
+        of attribute reads keeps the buckets truthful without requiring
+        callbacks from the engine.
+        """
+        for eid, execution in self.executions.items():
+            if self._status_seen.get(eid) is not execution.status:
+                self._set_status(execution, execution.status)
 
     async def cancel_execution(self, execution_id: str) -> bool:
         """Cancel a running workflow execution."""
@@ -101,7 +163,7 @@ class WorkflowService:
         try:
             success = await self.execution_engine.cancel_workflow(execution_id)
             if success:
-                execution.status = WorkflowStatus.CANCELLED
+                self._set_status(execution, WorkflowStatus.CANCELLED)
                 execution.completed_at = datetime.now(UTC)
                 self.logger.info(f"Cancelled workflow execution: {execution_id}")
 
@@ -112,24 +174,48 @@ class WorkflowService:
             return False
 
     def get_execution_status(self, execution_id: str) -> dict[str, Any] | None:
-        """Get detailed status of workflow execution."""
+        """Get detailed status of workflow execution.
+
+        The 11-key snapshot (three isoformat calls included) is rebuilt
+        only when the execution visibly changed; polling loops between
+        changes get the cached dict back.
+        """
         execution = self.get_execution(execution_id)
         if not execution:
             return None
 
-        return {
+        key = (execution.status, execution.current_step, execution.get_progress(), execution.completed_at)
+        cached = self._status_snapshots.get(execution_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        snapshot = {
             "id": execution.id,
             "template_id": execution.template_id,
             "status": execution.status.value,
             "current_step": execution.current_step,
-            "progress": execution.progress,
+            "progress": execution.get_progress(),
             "created_at": execution.created_at.isoformat() if execution.created_at else None,
             "started_at": execution.started_at.isoformat() if execution.started_at else None,
             "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
-            "results": execution.results,
-            "errors": execution.errors,
+            "results": execution.step_results,
+            "errors": list(execution.error_log),
             "checkpoints": execution.checkpoints,
         }
+        self._status_snapshots[execution_id] = (key, snapshot)
+        return snapshot
+
+    def get_execution_progress(self, execution_id: str) -> tuple[str, int | None, float] | None:
+        """Get (status, current_step, progress) for an execution.
+
+        Tuple form for pure polling callers — no dict allocation and no
+        timestamp formatting.
+        """
+        execution = self.get_execution(execution_id)
+        if not execution:
+            return None
+
+        return (execution.status.value, execution.current_step, execution.get_progress())
 
     def cleanup_completed_executions(self, max_age_hours: int = 24) -> int:
         """Clean up old completed executions."""
@@ -138,16 +224,24 @@ class WorkflowService:
         cutoff_time = datetime.now(UTC) - timedelta(hours=max_age_hours)
         cleaned_count = 0
 
-        # Find executions to clean up
-        to_remove = []
-        for execution_id, execution in self.executions.items():
-            if execution.status in {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED}:
-                if execution.completed_at and execution.completed_at < cutoff_time:
-                    to_remove.append(execution_id)
-
-        # Remove them
-        for execution_id in to_remove:
-            self.executions.pop(execution_id, None)
+        # Terminal transitions push onto the completion heap, so cleanup
+        # pops expired entries off the top instead of scanning the store:
+        # O(k log N) in the number actually removed
+        self._reconcile_status_index()
+        heap = self._completion_heap
+        while heap and heap[0][0] < cutoff_time:
+            _, execution_id = heapq.heappop(heap)
+            execution = self.executions.get(execution_id)
+            if execution is None or execution.status not in _TERMINAL_STATUSES:
+                continue
+
+            completed_at = execution.completed_at
+            if completed_at is not None and completed_at >= cutoff_time:
+                # Heap key predates the real completion time; re-file it
+                heapq.heappush(heap, (completed_at, execution_id))
+                continue
+
+            self._discard_execution(execution_id)
             cleaned_count += 1
 
         if cleaned_count > 0:
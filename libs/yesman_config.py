@@ -20,6 +20,14 @@ from .core.config_loader import (
 )
 from .core.config_schema import YesmanConfigSchema
 
+# Prefer the libyaml C loader when available; same safety as SafeLoader
+# but parses in C
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Sentinel distinguishing "key absent" from a stored None in the
+# dot-path cache below
+_MISSING = object()
+
 
 class YesmanConfig:
     """Main configuration class for Yesman.
@@ -45,9 +53,16 @@ class YesmanConfig:
         self.root_dir = Path("~/.scripton/yesman").expanduser()
         self.global_path = self.root_dir / "yesman.yaml"
         self.local_path = Path.cwd() / ".scripton" / "yesman" / "yesman.yaml"
+        self._sessions_dir = self.root_dir / "sessions"
 
-        # Convert schema to dict for backward compatibility
-        self.config = self._config_schema.model_dump()
+        # Plain-dict view of the schema, built lazily on first access
+        # (see the config property); model_dump walks the whole Pydantic
+        # tree and most startups never read more than a few keys
+        self._config_dict: dict[str, Any] | None = None
+
+        # Resolved dot-path lookups; hot callers ask for the same keys
+        # repeatedly, so each path is walked once per config generation
+        self._get_cache: dict[str, object] = {}
 
         # Setup logging
         self._setup_logging()
@@ -88,12 +103,19 @@ class YesmanConfig:
         """Create necessary directories."""
         directories = [
             self.root_dir,
-            self.root_dir / "sessions",  # Default sessions directory
+            self._sessions_dir,  # Default sessions directory
         ]
 
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def config(self) -> dict[str, Any]:
+        """Plain-dict view of the configuration (backward compatibility)."""
+        if self._config_dict is None:
+            self._config_dict = self._config_schema.model_dump()
+        return self._config_dict
+
     def get(self, key: str, default: object = None) -> object:
         """Get configuration value by key (backward compatibility).
 
@@ -102,25 +124,27 @@ class YesmanConfig:
         Returns:
             Description of return value
         """
-        # Handle dot notation
-        keys = key.split(".")
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        value = self._get_cache.get(key, _MISSING)
+        if value is _MISSING:
+            # Handle dot notation
+            value = self.config
+            for k in key.split("."):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
+
+        return default if value is _MISSING else value
 
     def save(self, new_config_data: dict[str, Any]) -> None:
         """Save configuration updates to local file."""
         # Load current local config
         current_local_cfg: dict[str, Any] = {}
         if self.local_path.exists():
-            with open(self.local_path, encoding="utf-8") as f:
-                current_local_cfg = yaml.safe_load(f) or {}
+            with open(self.local_path, "rb") as f:
+                current_local_cfg = yaml.load(f.read(), Loader=_SAFE_LOADER) or {}  # noqa: S506
 
         # Merge with new data
         updated_local_cfg = {**current_local_cfg, **new_config_data}
@@ -136,11 +160,12 @@ class YesmanConfig:
         # Add the new local config as a source and reload
         self._loader.add_source(DictSource(new_config_data))
         self._config_schema = self._loader.reload()
-        self.config = self._config_schema.model_dump()
+        self._config_dict = None
+        self._get_cache.clear()
 
     def get_sessions_dir(self) -> Path:
         """Get sessions directory path."""
-        return self.root_dir / "sessions"
+        return self._sessions_dir
 
     def get_workspace_config(self) -> dict | None:
         """Get workspace configuration."""
@@ -153,7 +178,8 @@ class YesmanConfig:
     def reload(self) -> None:
         """Reload configuration from all sources."""
         self._config_schema = self._loader.reload()
-        self.config = self._config_schema.model_dump()
+        self._config_dict = None
+        self._get_cache.clear()
         self.logger.info("Configuration reloaded")
 
     def validate(self) -> bool:
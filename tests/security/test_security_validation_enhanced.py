@@ -0,0 +1,167 @@
+"""Tests for the enhanced security validation script's scanner and cache."""
+
+import importlib.util
+import sys
+import tempfile
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+_SCRIPT_PATH = Path(__file__).parents[2] / "scripts" / "security_validation_enhanced.py"
+
+
+def _load_script() -> types.ModuleType:
+    """Load the scanner script as a module.
+
+    The script imports ``libs.dashboard.security_metrics_integration``,
+    which is not part of the tree; a stub supplies the ``SecurityMetrics``
+    name the scanner only uses on its event-publishing path.
+    """
+    stub = types.ModuleType("libs.dashboard.security_metrics_integration")
+    stub.SecurityMetrics = dict
+    sys.modules.setdefault("libs.dashboard.security_metrics_integration", stub)
+
+    spec = importlib.util.spec_from_file_location("security_validation_enhanced", _SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+secval = _load_script()
+
+
+@pytest.fixture
+def scan_dir() -> Iterator[Path]:
+    """Neutrally named directory for scan targets.
+
+    pytest's tmp_path embeds the test name, and paths containing "test"
+    trip the scanner's false-positive filter, so targets live elsewhere.
+    """
+    with tempfile.TemporaryDirectory(prefix="secscan-") as name:
+        yield Path(name)
+
+
+@pytest.fixture
+def validator(tmp_path: Path) -> "secval.EnhancedSecurityValidator":
+    """Validator isolated to a per-test project root and cache directory."""
+    instance = secval.EnhancedSecurityValidator(publish_events=False)
+    instance.project_root = tmp_path
+    instance.cache_dir = tmp_path / "sec-cache"
+    return instance
+
+
+class TestPatternDetection:
+    """Test cases for per-file security scanning."""
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_detects_dangerous_patterns(validator, scan_dir: Path) -> None:
+        """An eval call is flagged by both the pattern and AST checks."""
+        target = scan_dir / "danger.py"
+        target.write_text("result = eval(user_input)\n")
+
+        success, _ = await validator.validate_file_with_timing(target)
+
+        assert not success
+        assert any("eval_usage" in error for error in validator.errors)
+        assert any("dangerous_function" in error for error in validator.errors)
+        assert validator.violation_counts["critical"] >= 1
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_clean_file_passes(validator, scan_dir: Path) -> None:
+        """A harmless file produces no errors."""
+        target = scan_dir / "clean.py"
+        target.write_text("def add(a, b):\n    return a + b\n")
+
+        success, _ = await validator.validate_file_with_timing(target)
+
+        assert success
+        assert validator.errors == []
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_commented_patterns_are_skipped(validator, scan_dir: Path) -> None:
+        """Patterns inside comment lines are not reported."""
+        target = scan_dir / "commented.py"
+        target.write_text("# never call eval(something) here\nx = 1\n")
+
+        success, _ = await validator.validate_file_with_timing(target)
+
+        assert success
+        assert validator.errors == []
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_non_python_files_are_ignored(validator, scan_dir: Path) -> None:
+        """Only .py files are scanned."""
+        target = scan_dir / "notes.txt"
+        target.write_text("eval(whatever)\n")
+
+        success, scan_time = await validator.validate_file_with_timing(target)
+
+        assert success
+        assert scan_time == 0
+
+
+class TestResultCache:
+    """Test cases for the content-addressed scan-result cache."""
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_cached_result_replays_identically(validator, scan_dir: Path) -> None:
+        """A second scan of unchanged content replays the cached findings."""
+        target = scan_dir / "danger.py"
+        target.write_text("result = eval(user_input)\n")
+
+        await validator.validate_file_with_timing(target)
+        first_errors = list(validator.errors)
+        first_counts = dict(validator.violation_counts)
+        assert any(validator.cache_dir.rglob("*.json"))
+
+        replay = secval.EnhancedSecurityValidator(publish_events=False)
+        replay.project_root = scan_dir
+        replay.cache_dir = validator.cache_dir
+        await replay.validate_file_with_timing(target)
+
+        assert replay.errors == first_errors
+        assert replay.violation_counts == first_counts
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_cached_result_remaps_to_new_path(validator, scan_dir: Path) -> None:
+        """Identical content at another path reports against that path."""
+        original = scan_dir / "danger.py"
+        original.write_text("result = eval(user_input)\n")
+        await validator.validate_file_with_timing(original)
+
+        moved = scan_dir / "renamed.py"
+        moved.write_text(original.read_text())
+
+        replay = secval.EnhancedSecurityValidator(publish_events=False)
+        replay.project_root = scan_dir
+        replay.cache_dir = validator.cache_dir
+        await replay.validate_file_with_timing(moved)
+
+        assert replay.errors
+        assert all(error.startswith(str(moved)) for error in replay.errors)
+
+    @pytest.mark.security
+    @staticmethod
+    async def test_changed_content_misses_cache(validator, scan_dir: Path) -> None:
+        """Edited content is rescanned rather than served from cache."""
+        target = scan_dir / "danger.py"
+        target.write_text("result = eval(user_input)\n")
+        await validator.validate_file_with_timing(target)
+
+        target.write_text("def add(a, b):\n    return a + b\n")
+
+        replay = secval.EnhancedSecurityValidator(publish_events=False)
+        replay.project_root = scan_dir
+        replay.cache_dir = validator.cache_dir
+        success, _ = await replay.validate_file_with_timing(target)
+
+        assert success
+        assert replay.errors == []
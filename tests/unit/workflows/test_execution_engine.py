@@ -0,0 +1,65 @@
+"""Tests for the workflow execution engine's step-result cache keys."""
+
+import pytest
+
+try:
+    from libs.workflows import execution_engine
+    from libs.workflows.execution_engine import WorkflowExecutionEngine
+    from libs.workflows.models import StepType, WorkflowStep
+except ImportError:
+    # The engine module imports the LangChain stack at module level
+    pytest.skip("libs.workflows requires a working LangChain installation", allow_module_level=True)
+
+
+def _make_step(prompt: str = "do the thing", context: dict | None = None) -> WorkflowStep:
+    """Build a step with the fields the fingerprint reads."""
+    return WorkflowStep(id="step-1", type=StepType.GENERAL, prompt=prompt, context=context or {})
+
+
+class TestStepFingerprint:
+    """Test cases for content-addressed step fingerprints."""
+
+    @staticmethod
+    def test_fingerprint_is_stable() -> None:
+        """Identical inputs always produce the same fingerprint."""
+        step = _make_step(context={"key": "value"})
+        first = WorkflowExecutionEngine._step_fingerprint(step, "prompt", "custom")
+        second = WorkflowExecutionEngine._step_fingerprint(step, "prompt", "custom")
+        assert first == second
+
+    @staticmethod
+    def test_fingerprint_changes_with_inputs() -> None:
+        """Any input component changing yields a different fingerprint."""
+        step = _make_step(context={"key": "value"})
+        base = WorkflowExecutionEngine._step_fingerprint(step, "prompt", "custom")
+
+        assert WorkflowExecutionEngine._step_fingerprint(step, "other prompt", "custom") != base
+        assert WorkflowExecutionEngine._step_fingerprint(step, "prompt", "other custom") != base
+        assert WorkflowExecutionEngine._step_fingerprint(_make_step(context={"key": "other"}), "prompt", "custom") != base
+
+    @staticmethod
+    def test_fingerprint_includes_cache_version(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Bumping the cache version invalidates every prior fingerprint."""
+        step = _make_step()
+        before = WorkflowExecutionEngine._step_fingerprint(step, "prompt", "custom")
+
+        monkeypatch.setattr(execution_engine, "_STEP_CACHE_VERSION", "next-model")
+        after = WorkflowExecutionEngine._step_fingerprint(step, "prompt", "custom")
+        assert before != after
+
+
+class TestFormatContext:
+    """Test cases for the cached context-block formatter."""
+
+    @staticmethod
+    def test_format_context_joins_items() -> None:
+        """Items render one per line in the prompt block."""
+        block = execution_engine._format_context((("env", "prod"), ("region", "eu")))
+        assert block == "- env: prod\n- region: eu"
+
+    @staticmethod
+    def test_format_context_is_keyed_by_content() -> None:
+        """Equal item tuples share one cached string regardless of identity."""
+        first = execution_engine._format_context(tuple([("k", "v")]))
+        second = execution_engine._format_context(tuple([("k", "v")]))
+        assert first is second
@@ -0,0 +1,129 @@
+"""Tests for workflow data models."""
+
+import pytest
+
+try:
+    from libs.workflows.models import StepType, WorkflowConfig, WorkflowExecution
+except ImportError:
+    # The workflows package imports the LangChain stack at package level
+    pytest.skip("libs.workflows requires a working LangChain installation", allow_module_level=True)
+
+
+def _make_config(steps: list[dict]) -> WorkflowConfig:
+    """Build a minimal workflow config around the given step dicts."""
+    return WorkflowConfig(name="test", description="test workflow", steps=steps)
+
+
+class TestWorkflowExecution:
+    """Test cases for WorkflowExecution state tracking."""
+
+    @staticmethod
+    def test_record_result_counts_unique_steps() -> None:
+        """Recording a result bumps the counter once per step id."""
+        execution = WorkflowExecution(config=_make_config([{"id": "a", "prompt": "p"}, {"id": "b", "prompt": "p"}]))
+
+        execution.record_result("a", "first")
+        assert execution.completed_count == 1
+
+        # Overwriting the same step must not double-count it
+        execution.record_result("a", "second")
+        assert execution.completed_count == 1
+        assert execution.step_results["a"] == "second"
+
+        execution.record_result("b", "done")
+        assert execution.completed_count == 2
+
+    @staticmethod
+    def test_get_progress() -> None:
+        """Progress is the completed fraction of configured steps."""
+        execution = WorkflowExecution(config=_make_config([{"id": "a", "prompt": "p"}, {"id": "b", "prompt": "p"}]))
+        assert execution.get_progress() == 0.0
+
+        execution.record_result("a", "ok")
+        assert execution.get_progress() == 50.0
+
+        execution.record_result("b", "ok")
+        assert execution.get_progress() == 100.0
+
+    @staticmethod
+    def test_get_progress_without_config() -> None:
+        """An execution with no config reports zero progress."""
+        execution = WorkflowExecution()
+        assert execution.get_progress() == 0.0
+
+    @staticmethod
+    def test_checkpoints_store_deltas_and_restore_full_state() -> None:
+        """Each checkpoint keeps only new results; restore merges the chain."""
+        steps = [{"id": step_id, "prompt": "p"} for step_id in ("a", "b", "c")]
+        execution = WorkflowExecution(config=_make_config(steps))
+
+        execution.record_result("a", "ra")
+        execution.create_checkpoint(0)
+        execution.record_result("b", "rb")
+        execution.create_checkpoint(1)
+        execution.record_result("c", "rc")
+        execution.create_checkpoint(2)
+
+        # Deltas are incremental, not cumulative
+        assert execution.checkpoints[0].delta_results == {"a": "ra"}
+        assert execution.checkpoints[1].delta_results == {"b": "rb"}
+        assert execution.checkpoints[2].delta_results == {"c": "rc"}
+        assert execution.checkpoints[2].parent_step_index == 1
+
+        # Restoring walks the parent chain back to the root
+        assert execution.restore_checkpoint_results(0) == {"a": "ra"}
+        assert execution.restore_checkpoint_results(1) == {"a": "ra", "b": "rb"}
+        assert execution.restore_checkpoint_results(2) == {"a": "ra", "b": "rb", "c": "rc"}
+
+
+class TestWorkflowConfig:
+    """Test cases for WorkflowConfig step conversion and scheduling."""
+
+    @staticmethod
+    def test_to_workflow_steps_is_memoized() -> None:
+        """The dict-to-dataclass conversion runs once per config."""
+        config = _make_config([{"id": "a", "prompt": "p", "type": "analysis", "dependencies": ["b"]}, {"id": "b", "prompt": "p"}])
+        steps = config.to_workflow_steps()
+
+        assert steps[0].type is StepType.ANALYSIS
+        assert steps[0].dependencies == frozenset({"b"})
+        assert config.to_workflow_steps() is steps
+
+    @staticmethod
+    def test_topological_levels_groups_independent_steps() -> None:
+        """Steps without mutual dependencies land in the same level."""
+        config = _make_config(
+            [
+                {"id": "a", "prompt": "p"},
+                {"id": "b", "prompt": "p"},
+                {"id": "c", "prompt": "p", "dependencies": ["a", "b"]},
+                {"id": "d", "prompt": "p", "dependencies": ["c"]},
+            ],
+        )
+
+        levels = [[step.id for step in level] for level in config.topological_levels()]
+        assert [sorted(level) for level in levels] == [["a", "b"], ["c"], ["d"]]
+
+    @staticmethod
+    def test_topological_levels_drops_cycle_members(caplog: pytest.LogCaptureFixture) -> None:
+        """Steps caught in a dependency cycle are skipped with a warning."""
+        config = _make_config(
+            [
+                {"id": "a", "prompt": "p"},
+                {"id": "b", "prompt": "p", "dependencies": ["c"]},
+                {"id": "c", "prompt": "p", "dependencies": ["b"]},
+            ],
+        )
+
+        with caplog.at_level("WARNING", logger="libs.workflows.models"):
+            levels = config.topological_levels()
+
+        assert [[step.id for step in level] for level in levels] == [["a"]]
+        assert any("cycle" in record.message.lower() for record in caplog.records)
+
+    @staticmethod
+    def test_topological_levels_ignores_unknown_dependencies() -> None:
+        """Dependencies on ids outside the config do not block scheduling."""
+        config = _make_config([{"id": "a", "prompt": "p", "dependencies": ["missing"]}])
+        levels = config.topological_levels()
+        assert [[step.id for step in level] for level in levels] == [["a"]]
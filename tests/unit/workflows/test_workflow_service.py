@@ -0,0 +1,91 @@
+"""Tests for the workflow service's execution tracking and status snapshots."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+try:
+    from libs.workflows.models import WorkflowConfig, WorkflowExecution, WorkflowStatus
+    from libs.workflows.workflow_service import WorkflowService
+except ImportError:
+    # The workflows package imports the LangChain stack at package level
+    pytest.skip("libs.workflows requires a working LangChain installation", allow_module_level=True)
+
+
+def _make_config() -> WorkflowConfig:
+    """Build a minimal two-step workflow config."""
+    return WorkflowConfig(name="test", description="test workflow", steps=[{"id": "a", "prompt": "p"}, {"id": "b", "prompt": "p"}])
+
+
+@pytest.fixture
+def service() -> WorkflowService:
+    """Service wired to mock engine and template manager."""
+    return WorkflowService(execution_engine=AsyncMock(), template_manager=MagicMock())
+
+
+def _add_execution(service: WorkflowService, execution_id: str = "exec-1") -> WorkflowExecution:
+    """Register an execution with the service the way start_workflow does."""
+    execution = WorkflowExecution(id=execution_id, template_id="tpl", config=_make_config(), context={}, status=WorkflowStatus.PENDING, created_at=datetime.now(UTC))
+    service.executions[execution.id] = execution
+    service._created_order.append(execution.id)
+    service._by_status[execution.status][execution.id] = None
+    service._status_seen[execution.id] = execution.status
+    return execution
+
+
+class TestWorkflowService:
+    """Test cases for execution status reporting."""
+
+    @staticmethod
+    async def test_start_workflow_constructs_execution(service: WorkflowService) -> None:
+        """start_workflow builds and stores an execution for the template."""
+        service.template_manager.get_template_config.return_value = _make_config()
+
+        execution_id = await service.start_workflow("tpl", context={"key": "value"})
+
+        execution = service.get_execution(execution_id)
+        assert execution is not None
+        assert execution.template_id == "tpl"
+        assert execution.context == {"key": "value"}
+        assert execution.created_at is not None
+
+    @staticmethod
+    def test_get_execution_status_builds_snapshot(service: WorkflowService) -> None:
+        """The snapshot exposes the execution's real fields."""
+        execution = _add_execution(service)
+        execution.record_result("a", "done")
+
+        snapshot = service.get_execution_status(execution.id)
+
+        assert snapshot["id"] == execution.id
+        assert snapshot["template_id"] == "tpl"
+        assert snapshot["status"] == "pending"
+        assert snapshot["progress"] == 50.0
+        assert snapshot["results"] == {"a": "done"}
+        assert snapshot["errors"] == []
+        assert snapshot["created_at"] == execution.created_at.isoformat()
+
+    @staticmethod
+    def test_get_execution_status_caches_until_change(service: WorkflowService) -> None:
+        """Repeated polls return the cached snapshot until the execution moves."""
+        execution = _add_execution(service)
+
+        first = service.get_execution_status(execution.id)
+        assert service.get_execution_status(execution.id) is first
+
+        # A recorded result changes the progress component of the key
+        execution.record_result("a", "done")
+        rebuilt = service.get_execution_status(execution.id)
+        assert rebuilt is not first
+        assert rebuilt["progress"] == 50.0
+        assert service.get_execution_status(execution.id) is rebuilt
+
+    @staticmethod
+    def test_get_execution_progress_tuple(service: WorkflowService) -> None:
+        """The lightweight progress accessor mirrors the snapshot fields."""
+        execution = _add_execution(service)
+        execution.record_result("a", "done")
+
+        assert service.get_execution_progress(execution.id) == ("pending", None, 50.0)
+        assert service.get_execution_progress("missing") is None